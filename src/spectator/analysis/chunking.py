@@ -7,6 +7,19 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
+_SUFFIX_STRATEGY = {
+    ".log": "log",
+    ".jsonl": "log",
+    ".txt": "log",
+    ".md": "headings",
+    ".rst": "headings",
+    ".py": "python_ast",
+}
+# Line boundaries splitlines() honours besides "\n"; the newline-counting fast path
+# in _split_oversize is only valid when none of them occur.
+_OTHER_LINE_BREAKS = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
 @dataclass(slots=True)
 class Chunk:
     id: str
@@ -29,7 +42,7 @@ def chunk_file(
     normalized = _normalize_newlines(text)
     if normalized == "":
         return []
-    resolved_strategy = _resolve_strategy(path, strategy)
+    resolved_strategy = resolve_strategy(path, strategy)
     if resolved_strategy == "headings":
         chunks = _chunk_by_headings(path, normalized, max_chars)
     elif resolved_strategy == "python_ast":
@@ -51,18 +64,11 @@ def _normalize_newlines(text: str) -> str:
     return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
-def _resolve_strategy(path: str, strategy: str) -> str:
+def resolve_strategy(path: str, strategy: str = "auto") -> str:
     lowered = (strategy or "auto").lower()
     if lowered != "auto":
         return lowered
-    suffix = Path(path).suffix.lower()
-    if suffix in {".log", ".jsonl", ".txt"}:
-        return "log"
-    if suffix in {".md", ".rst"}:
-        return "headings"
-    if suffix == ".py":
-        return "python_ast"
-    return "fixed"
+    return _SUFFIX_STRATEGY.get(Path(path).suffix.lower(), "fixed")
 
 
 def _chunk_by_headings(path: str, text: str, max_chars: int) -> list[Chunk]:
@@ -122,11 +128,13 @@ def _extract_headings(lines: list[str]) -> list[tuple[int, str]]:
 
 
 def _chunk_by_python_ast(path: str, text: str, max_chars: int) -> list[Chunk]:
+    lines = text.splitlines(keepends=True)
+    if len(text) <= max_chars and not _TOP_LEVEL_DEF_RE.search(text):
+        return [_build_chunk(path, "module", 1, len(lines), text)]
     try:
         tree = ast.parse(text)
     except SyntaxError:
         return _chunk_fixed(path, text, max_chars, overlap_chars=0)
-    lines = text.splitlines(keepends=True)
     nodes: list[tuple[int, int, str]] = []
     for node in tree.body:
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
@@ -235,6 +243,19 @@ def _split_oversize(
 ) -> list[Chunk]:
     if len(text) <= max_chars:
         return [_build_chunk(path, title, start_line, end_line, text)]
+    if len(text) <= 2 * max_chars and not _OTHER_LINE_BREAKS.search(text):
+        cut = text.rfind("\n", 0, max_chars) + 1
+        if cut > 0 and len(text) - cut <= max_chars:
+            second_start = start_line + text.count("\n", 0, cut)
+            second_end = second_start + text.count("\n", cut) - (1 if text.endswith("\n") else 0)
+            return _label_parts(
+                path,
+                title,
+                [
+                    _build_chunk(path, title, start_line, second_start - 1, text[:cut]),
+                    _build_chunk(path, title, second_start, second_end, text[cut:]),
+                ],
+            )
     lines = text.splitlines(keepends=True)
     parts: list[Chunk] = []
     buf: list[str] = []
@@ -264,6 +285,10 @@ def _split_oversize(
     if buf:
         part_end_line = part_start_line + len(buf) - 1
         parts.append(_build_chunk(path, title, part_start_line, part_end_line, "".join(buf)))
+    return _label_parts(path, title, parts)
+
+
+def _label_parts(path: str, title: str, parts: list[Chunk]) -> list[Chunk]:
     if len(parts) == 1:
         return parts
     total_parts = len(parts)
@@ -411,12 +436,16 @@ def _symbol_ratio(text: str) -> float:
 
 
 def _looks_like_log_prefix(text: str) -> bool:
-    if ":" not in text:
+    colon = text.find(":", 0, 33)
+    if colon < 2:
         return False
-    head, _sep, _rest = text.partition(":")
-    if 2 <= len(head) <= 32 and head.replace("_", "").replace("-", "").isalnum():
-        return True
-    return False
+    has_alnum = False
+    for ch in text[:colon]:
+        if ch.isalnum():
+            has_alnum = True
+        elif ch != "_" and ch != "-":
+            return False
+    return has_alnum
 
 
 _LOG_LINE_RE = re.compile(
@@ -431,4 +460,5 @@ _LOG_LINE_RE = re.compile(
     r")"
 )
 _PREFIX_RE = re.compile(r"^[A-Za-z0-9_.-]{2,}:\s")
+_TOP_LEVEL_DEF_RE = re.compile(r"^[ \t\f]*(?:async\s+def|def|class)\s|^@", re.M)
 _SYMBOL_CHARS = set("[]{}()=:+-_/\\|<>.,'\"")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -12,18 +14,23 @@ from spectator.core.types import Checkpoint, State
 from spectator.prompts import get_role_prompt
 from spectator.runtime.pipeline import RoleSpec, run_pipeline
 from spectator.tools import build_readonly_registry
-from spectator.analysis.chunking import chunk_file
+from spectator.analysis.chunking import chunk_file, resolve_strategy
 
 MAX_FILE_BYTES = 1_000_000
 DEFAULT_TAIL_LINES = 200
 DEFAULT_LIST_LIMIT = 500
+MAX_MAP_WORKERS = 8
 
 
 def resolve_repo_root() -> Path:
-    env_root = os.getenv("REPO_ROOT")
+    return _resolve_repo_root_cached(os.getenv("REPO_ROOT"), os.getcwd())
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_repo_root_cached(env_root: str | None, cwd: str) -> Path:
     if env_root:
         return Path(env_root).resolve()
-    return Path.cwd().resolve()
+    return Path(cwd).resolve()
 
 
 def list_repo_files(
@@ -35,10 +42,13 @@ def list_repo_files(
     if target.is_file():
         return [str(target.relative_to(repo_root))]
     results: list[str] = []
+    append = results.append
+    count = 0
     for path in sorted(target.rglob("*")):
         if path.is_file():
-            results.append(str(path.relative_to(repo_root)))
-            if len(results) >= limit:
+            append(str(path.relative_to(repo_root)))
+            count += 1
+            if count >= limit:
                 break
     return results
 
@@ -48,30 +58,43 @@ def read_repo_file_tail(
     path: str,
     max_lines: int = DEFAULT_TAIL_LINES,
 ) -> str:
-    target = _resolve_path(repo_root, path)
-    if not target.is_file():
-        raise ValueError("path is not a file")
-    data = target.read_bytes()
-    if len(data) > MAX_FILE_BYTES:
-        data = data[-MAX_FILE_BYTES:]
-    text = data.decode("utf-8", errors="replace")
-    lines = text.splitlines()
+    data = _read_repo_file_capped(repo_root, path, from_end=True)
     if max_lines <= 0:
         return ""
+    text = data.decode("utf-8", errors="replace")
+    lines = text[_tail_start(text, max_lines) :].splitlines()
     return "\n".join(lines[-max_lines:])
 
 
+def _tail_start(text: str, max_lines: int) -> int:
+    # Walk back max_lines + 1 newlines so the slice still holds the last
+    # max_lines lines, even when the text ends with a newline.
+    pos = len(text)
+    for _ in range(max_lines + 1):
+        pos = text.rfind("\n", 0, pos)
+        if pos == -1:
+            return 0
+    return pos + 1
+
+
 def read_repo_file(
     repo_root: Path,
     path: str,
 ) -> str:
+    data = _read_repo_file_capped(repo_root, path)
+    return data.decode("utf-8", errors="replace")
+
+
+def _read_repo_file_capped(repo_root: Path, path: str, *, from_end: bool = False) -> bytes:
     target = _resolve_path(repo_root, path)
     if not target.is_file():
         raise ValueError("path is not a file")
-    data = target.read_bytes()
-    if len(data) > MAX_FILE_BYTES:
-        data = data[:MAX_FILE_BYTES]
-    return data.decode("utf-8", errors="replace")
+    with target.open("rb") as handle:
+        if from_end:
+            size = os.fstat(handle.fileno()).st_size
+            if size > MAX_FILE_BYTES:
+                handle.seek(size - MAX_FILE_BYTES)
+        return handle.read(MAX_FILE_BYTES)
 
 
 def summarize_repo_file(
@@ -108,15 +131,14 @@ def summarize_repo_file(
         updated_ts=0.0,
         state=State(),
     )
-    tracer = TraceWriter("introspect", base_dir=data_root / "traces")
-    map_calls = 0
-    reduce_calls = 0
-    total_chars = 0
-    for chunk in chunks:
-        total_chars += len(chunk.text)
-        tracer.write(
+    with TraceWriter("introspect", base_dir=data_root / "traces", keep_open=True) as tracer:
+        map_calls = 0
+        reduce_calls = 0
+        total_chars = sum(len(chunk.text) for chunk in chunks)
+        chunk_ts = time.time()
+        tracer.write_many(
             TraceEvent(
-                ts=time.time(),
+                ts=chunk_ts,
                 kind="introspect_chunk",
                 data={
                     "id": chunk.id,
@@ -127,71 +149,72 @@ def summarize_repo_file(
                     "chars": len(chunk.text),
                 },
             )
+            for chunk in chunks
         )
-    footer_strategy = _resolve_chunking_strategy(path, chunking)
-    if footer_strategy == "log":
-        log_chunks = [chunk for chunk in chunks if _is_log_chunk(chunk)]
-        nonlog_chunks = [chunk for chunk in chunks if not _is_log_chunk(chunk)]
-        log_summary, log_map, log_reduce = _summarize_chunk_group(
-            path,
-            log_chunks,
-            instruction="Summarize log events and initialization details.",
-            checkpoint=checkpoint,
-            roles=roles,
-            backend=backend,
-            executor=executor,
-            tracer=tracer,
-            max_chars=max_chars,
-        )
-        nonlog_summary, nonlog_map, nonlog_reduce = _summarize_chunk_group(
-            path,
-            nonlog_chunks,
-            instruction="Summarize the non-log tail content.",
-            checkpoint=checkpoint,
-            roles=roles,
-            backend=backend,
-            executor=executor,
-            tracer=tracer,
-            max_chars=max_chars,
-        )
-        map_calls = log_map + nonlog_map
-        reduce_calls = log_reduce + nonlog_reduce
-        nonlog_lines = sum(
-            chunk.end_line - chunk.start_line + 1 for chunk in nonlog_chunks
-        )
+        footer_strategy = resolve_strategy(path, chunking)
+        if footer_strategy == "log":
+            log_chunks = [chunk for chunk in chunks if _is_log_chunk(chunk)]
+            nonlog_chunks = [chunk for chunk in chunks if not _is_log_chunk(chunk)]
+            log_summary, log_map, log_reduce = _summarize_chunk_group(
+                path,
+                log_chunks,
+                instruction="Summarize log events and initialization details.",
+                checkpoint=checkpoint,
+                roles=roles,
+                backend=backend,
+                executor=executor,
+                tracer=tracer,
+                max_chars=max_chars,
+            )
+            nonlog_summary, nonlog_map, nonlog_reduce = _summarize_chunk_group(
+                path,
+                nonlog_chunks,
+                instruction="Summarize the non-log tail content.",
+                checkpoint=checkpoint,
+                roles=roles,
+                backend=backend,
+                executor=executor,
+                tracer=tracer,
+                max_chars=max_chars,
+            )
+            map_calls = log_map + nonlog_map
+            reduce_calls = log_reduce + nonlog_reduce
+            nonlog_lines = sum(
+                chunk.end_line - chunk.start_line + 1 for chunk in nonlog_chunks
+            )
+            final_text = (
+                f"**Log Summary**\n{log_summary}\n\n"
+                f"**Non-log Tail** ({nonlog_lines} lines)\n{nonlog_summary}"
+            )
+        else:
+            summary_text, map_calls, reduce_calls = _summarize_chunk_group(
+                path,
+                chunks,
+                instruction=extra_instruction,
+                checkpoint=checkpoint,
+                roles=roles,
+                backend=backend,
+                executor=executor,
+                tracer=tracer,
+                max_chars=max_chars,
+            )
+            final_text = summary_text
         final_text = (
-            f"**Log Summary**\n{log_summary}\n\n"
-            f"**Non-log Tail** ({nonlog_lines} lines)\n{nonlog_summary}"
-        )
-    else:
-        summary_text, map_calls, reduce_calls = _summarize_chunk_group(
-            path,
-            chunks,
-            instruction=extra_instruction,
-            checkpoint=checkpoint,
-            roles=roles,
-            backend=backend,
-            executor=executor,
-            tracer=tracer,
-            max_chars=max_chars,
+            f"{final_text}\n\nChunks: {len(chunks)} "
+            f"(strategy={footer_strategy}, max_chars={max_chars})"
         )
-        final_text = summary_text
-    final_text = (
-        f"{final_text}\n\nChunks: {len(chunks)} "
-        f"(strategy={footer_strategy}, max_chars={max_chars})"
-    )
-    tracer.write(
-        TraceEvent(
-            ts=time.time(),
-            kind="introspect_done",
-            data={
-                "chunks": len(chunks),
-                "total_chars": total_chars,
-                "map_calls": map_calls,
-                "reduce_calls": reduce_calls,
-            },
+        tracer.write(
+            TraceEvent(
+                ts=time.time(),
+                kind="introspect_done",
+                data={
+                    "chunks": len(chunks),
+                    "total_chars": total_chars,
+                    "map_calls": map_calls,
+                    "reduce_calls": reduce_calls,
+                },
+            )
         )
-    )
     return {
         "summary": final_text,
         "trace_file": tracer.path.name,
@@ -238,12 +261,10 @@ def _build_reduce_prompt(
     instruction: str,
     max_chars: int,
 ) -> str:
-    lines: list[str] = []
-    for idx, (chunk, summary) in enumerate(zip(chunks, summaries), start=1):
-        lines.append(
-            f"Chunk {idx} ({chunk.title}, lines {chunk.start_line}-{chunk.end_line}):\n{summary}"
-        )
-    summary_block = "\n\n".join(lines)
+    pieces = [
+        f"Chunk {idx} ({chunk.title}, lines {chunk.start_line}-{chunk.end_line}):\n{summary}"
+        for idx, (chunk, summary) in enumerate(zip(chunks, summaries), start=1)
+    ]
     prefix = (
         "You are in introspection mode. You may use tools to read files under the repo root.\n"
         "Available tools: fs.read_text, fs.list_dir, system.time.\n"
@@ -254,7 +275,7 @@ def _build_reduce_prompt(
     allowed = max_chars - len(prefix) - len(suffix)
     if allowed < 0:
         allowed = 0
-    summary_block = _truncate_text(summary_block, allowed)
+    summary_block = _truncate_text("\n\n".join(pieces), allowed)
     prompt = f"{prefix}{summary_block}{suffix}"
     if len(prompt) > max_chars:
         prompt = _truncate_text(prompt, max_chars)
@@ -299,18 +320,16 @@ def _run_introspect_prompt(
     return final_text
 
 
-def _resolve_chunking_strategy(path: str, strategy: str) -> str:
-    lowered = (strategy or "auto").lower()
-    if lowered != "auto":
-        return lowered
-    suffix = Path(path).suffix.lower()
-    if suffix in {".log", ".jsonl", ".txt"}:
-        return "log"
-    if suffix in {".md", ".rst"}:
-        return "headings"
-    if suffix == ".py":
-        return "python_ast"
-    return "fixed"
+# Collects one map call's trace events so parallel chunks do not interleave.
+class _EventBuffer:
+    def __init__(self) -> None:
+        self.events: list[TraceEvent] = []
+
+    def write(self, event: TraceEvent) -> None:
+        self.events.append(event)
+
+    def write_many(self, events) -> None:
+        self.events.extend(events)
 
 
 def _summarize_chunk_group(
@@ -327,20 +346,40 @@ def _summarize_chunk_group(
 ) -> tuple[str, int, int]:
     if not chunks:
         return "No content to summarize.", 0, 0
-    summaries: list[str] = []
-    map_calls = 0
-    for chunk in chunks:
-        prompt = _build_chunk_prompt(path, chunk, instruction)
-        summary = _run_introspect_prompt(
-            prompt,
-            checkpoint=checkpoint,
-            roles=roles,
-            backend=backend,
-            executor=executor,
-            tracer=tracer,
-        )
-        summaries.append(summary)
-        map_calls += 1
+    prompts = [_build_chunk_prompt(path, chunk, instruction) for chunk in chunks]
+    if len(chunks) == 1 or not getattr(backend, "supports_concurrent_calls", False):
+        summaries = [
+            _run_introspect_prompt(
+                prompt,
+                checkpoint=checkpoint,
+                roles=roles,
+                backend=backend,
+                executor=executor,
+                tracer=tracer,
+            )
+            for prompt in prompts
+        ]
+    else:
+        buffers = [_EventBuffer() for _ in prompts]
+        with ThreadPoolExecutor(max_workers=min(MAX_MAP_WORKERS, len(chunks))) as pool:
+            futures = [
+                pool.submit(
+                    _run_introspect_prompt,
+                    prompt,
+                    checkpoint=checkpoint,
+                    roles=roles,
+                    backend=backend,
+                    executor=executor,
+                    tracer=buffer,
+                )
+                for prompt, buffer in zip(prompts, buffers)
+            ]
+            summaries = []
+            # Write each chunk's events as a contiguous block, in chunk order.
+            for future, buffer in zip(futures, buffers):
+                summaries.append(future.result())
+                tracer.write_many(buffer.events)
+    map_calls = len(summaries)
     reduce_prompt = _build_reduce_prompt(
         path,
         chunks,
@@ -4,7 +4,7 @@ import argparse
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 
 from spectator.runtime.condense import CondensePolicy
 
@@ -17,6 +17,20 @@ DEFAULT_MAX_CONDENSE_STATE_DELTA = 0.2
 DEFAULT_MAX_TOOL_FAIL_RATE_DELTA = 0.01
 DEFAULT_MAX_TRACE_BYTES_PER_TURN_DELTA = 10_000
 
+_BASELINE_KEYS = ("condense_state_per_turn", "tool_fail_rate", "trace_bytes_per_turn")
+
+_STATE_LIMIT_FIELDS = (
+    ("goals", "max_goals"),
+    ("open_loops", "max_open_loops"),
+    ("decisions", "max_decisions"),
+    ("constraints", "max_constraints"),
+    ("memory_tags", "max_memory_tags"),
+)
+
+# JSONDecoder.decode skips surrounding whitespace itself, so lines can be
+# decoded without a strip() copy.
+_JSON_DECODER = json.JSONDecoder()
+
 
 @dataclass(slots=True)
 class AnalysisSummary:
@@ -54,25 +68,23 @@ class AnalysisSummary:
         }
 
 
-def _load_trace_events(path: Path) -> list[dict[str, Any]]:
-    events: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for index, line in enumerate(handle, start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                events.append(json.loads(stripped))
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"Invalid JSON on line {index}.") from exc
-    return events
+def _iter_trace_events(handle: BinaryIO) -> Iterator[dict[str, Any]]:
+    decode = _JSON_DECODER.decode
+    for index, line in enumerate(handle, start=1):
+        if line.isspace():
+            continue
+        try:
+            yield decode(line.decode("utf-8"))
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSON on line {index}.") from exc
 
 
-def _load_checkpoint(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+def _load_checkpoint(path: Path) -> tuple[dict[str, Any], int]:
+    raw = path.read_bytes()
+    payload = _JSON_DECODER.decode(raw.decode("utf-8"))
     if "state" not in payload:
         raise ValueError("Checkpoint missing state payload.")
-    return payload
+    return payload, len(raw)
 
 
 def _require_list(payload: dict[str, Any], key: str) -> list[str]:
@@ -91,6 +103,15 @@ def _require_str(payload: dict[str, Any], key: str) -> str:
     return value
 
 
+def _has_duplicates(items: list[str]) -> bool:
+    seen: set[str] = set()
+    for item in items:
+        if item in seen:
+            return True
+        seen.add(item)
+    return False
+
+
 def _validate_checkpoint(
     checkpoint: dict[str, Any],
     policy: CondensePolicy,
@@ -98,21 +119,15 @@ def _validate_checkpoint(
 ) -> None:
     state = checkpoint.get("state", {})
     memory_refs = _require_list(state, "memory_refs")
-    if len(set(memory_refs)) != len(memory_refs):
+    if _has_duplicates(memory_refs):
         failures.append("Duplicate IDs found in memory_refs.")
-    granted = set(_require_list(state, "capabilities_granted"))
-    pending = set(_require_list(state, "capabilities_pending"))
-    if granted.intersection(pending):
+    granted = _require_list(state, "capabilities_granted")
+    pending = frozenset(_require_list(state, "capabilities_pending"))
+    if not pending.isdisjoint(granted):
         failures.append("Capabilities pending intersect with granted.")
 
-    state_limits = {
-        "goals": policy.max_goals,
-        "open_loops": policy.max_open_loops,
-        "decisions": policy.max_decisions,
-        "constraints": policy.max_constraints,
-        "memory_tags": policy.max_memory_tags,
-    }
-    for field, limit in state_limits.items():
+    for field, limit_attr in _STATE_LIMIT_FIELDS:
+        limit = getattr(policy, limit_attr)
         items = _require_list(state, field)
         if len(items) > limit:
             failures.append(
@@ -130,10 +145,11 @@ def _compare_baseline(
     failures: list[str],
 ) -> list[str]:
     baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
-    warnings: list[str] = []
-    for key in ("condense_state_per_turn", "tool_fail_rate", "trace_bytes_per_turn"):
-        if key not in baseline:
-            warnings.append(f"Baseline missing {key}; skipping.")
+    warnings = [
+        f"Baseline missing {key}; skipping." for key in _BASELINE_KEYS if key not in baseline
+    ]
+    if len(warnings) == len(_BASELINE_KEYS):
+        return warnings
     if "condense_state_per_turn" in baseline:
         delta = summary.condense_state_per_turn - baseline["condense_state_per_turn"]
         if delta > DEFAULT_MAX_CONDENSE_STATE_DELTA:
@@ -166,65 +182,64 @@ def analyze_soak(
     failures: list[str] = []
     warnings: list[str] = []
 
-    events = _load_trace_events(trace_path)
-    if not events:
-        failures.append("Trace contains no events.")
-
     event_counts: dict[str, int] = {}
     tool_counts: dict[str, int] = {}
     condense_counts: dict[str, int] = {}
     tool_ok = 0
     tool_fail = 0
-    tool_plan = 0
-    tool_start = 0
-    tool_done = 0
-    llm_req = 0
-    llm_done = 0
-    notes_patch_count = 0
     tool_start_ids: set[str] = set()
     tool_done_ids: set[str] = set()
+    event_total = 0
+    event_count_get = event_counts.get
+
+    with trace_path.open("rb") as trace_handle:
+        for event in _iter_trace_events(trace_handle):
+            event_total += 1
+            kind = event.get("kind")
+            if not isinstance(kind, str):
+                continue
+            event_counts[kind] = event_count_get(kind, 0) + 1
+            match kind:
+                case "tool_start":
+                    data = event.get("data")
+                    if isinstance(data, dict):
+                        tool_id = data.get("id")
+                        if isinstance(tool_id, str):
+                            tool_start_ids.add(tool_id)
+                        tool_name = data.get("tool")
+                        if isinstance(tool_name, str) and tool_name not in tool_counts:
+                            tool_counts[tool_name] = 0
+                case "tool_done":
+                    data = event.get("data")
+                    if isinstance(data, dict):
+                        tool_id = data.get("id")
+                        if isinstance(tool_id, str):
+                            tool_done_ids.add(tool_id)
+                        tool_name = data.get("tool")
+                        if isinstance(tool_name, str):
+                            tool_counts[tool_name] = tool_counts.get(tool_name, 0) + 1
+                        ok_value = data.get("ok")
+                        if ok_value is True:
+                            tool_ok += 1
+                        elif ok_value is False:
+                            tool_fail += 1
+                case "condense":
+                    data = event.get("data")
+                    if isinstance(data, dict):
+                        scope = data.get("scope")
+                        if isinstance(scope, str):
+                            condense_counts[scope] = condense_counts.get(scope, 0) + 1
+        trace_bytes = trace_handle.tell()
+
+    if not event_total:
+        failures.append("Trace contains no events.")
 
-    for event in events:
-        kind = event.get("kind")
-        if not isinstance(kind, str):
-            continue
-        event_counts[kind] = event_counts.get(kind, 0) + 1
-        data = event.get("data", {})
-        if not isinstance(data, dict):
-            data = {}
-        if kind == "llm_req":
-            llm_req += 1
-        elif kind == "llm_done":
-            llm_done += 1
-        elif kind == "tool_plan":
-            tool_plan += 1
-        elif kind == "tool_start":
-            tool_start += 1
-            tool_id = data.get("id")
-            if isinstance(tool_id, str):
-                tool_start_ids.add(tool_id)
-            tool_name = data.get("tool")
-            if isinstance(tool_name, str) and tool_name not in tool_counts:
-                tool_counts[tool_name] = 0
-        elif kind == "tool_done":
-            tool_done += 1
-            tool_id = data.get("id")
-            if isinstance(tool_id, str):
-                tool_done_ids.add(tool_id)
-            tool_name = data.get("tool")
-            if isinstance(tool_name, str):
-                tool_counts[tool_name] = tool_counts.get(tool_name, 0) + 1
-            ok_value = data.get("ok")
-            if ok_value is True:
-                tool_ok += 1
-            elif ok_value is False:
-                tool_fail += 1
-        elif kind == "condense":
-            scope = data.get("scope")
-            if isinstance(scope, str):
-                condense_counts[scope] = condense_counts.get(scope, 0) + 1
-        elif kind == "notes_patch":
-            notes_patch_count += 1
+    llm_req = event_counts.get("llm_req", 0)
+    llm_done = event_counts.get("llm_done", 0)
+    tool_plan = event_counts.get("tool_plan", 0)
+    tool_start = event_counts.get("tool_start", 0)
+    tool_done = event_counts.get("tool_done", 0)
+    notes_patch_count = event_counts.get("notes_patch", 0)
 
     if llm_req != llm_done:
         failures.append(f"llm_req ({llm_req}) != llm_done ({llm_done}).")
@@ -244,16 +259,14 @@ def analyze_soak(
         )
 
     policy = CondensePolicy()
-    checkpoint = _load_checkpoint(checkpoint_path)
+    checkpoint, checkpoint_bytes = _load_checkpoint(checkpoint_path)
     _validate_checkpoint(checkpoint, policy, failures)
 
-    resolved_turns = turns or event_counts.get("notes_patch", 0)
+    resolved_turns = turns or notes_patch_count
     if resolved_turns <= 0:
         failures.append("Unable to infer turns from trace; pass --turns.")
         resolved_turns = max(turns or 0, 1)
 
-    trace_bytes = trace_path.stat().st_size
-    checkpoint_bytes = checkpoint_path.stat().st_size
     trace_bytes_per_turn = trace_bytes / resolved_turns
     condense_state = condense_counts.get("state", 0)
     condense_state_per_turn = condense_state / resolved_turns
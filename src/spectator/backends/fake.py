@@ -2,30 +2,40 @@ from __future__ import annotations
 
 import json
 import os
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Iterable, List
+from typing import Any, Deque, Iterable, List
 
 from spectator.backends.registry import register_backend
 
 _TOOL_RESULTS_MARKER = "TOOL_RESULTS:\n"
+_TOOL_OUTPUT_PLACEHOLDER = "{{TOOL_OUTPUT}}"
 
 
 @dataclass(slots=True)
 class FakeBackend:
-    responses: List[str] = field(default_factory=list)
-    role_responses: dict[str, List[str]] = field(default_factory=dict)
+    responses: Deque[str] = field(default_factory=deque)
+    role_responses: dict[str, Deque[str]] = field(default_factory=dict)
     calls: List[dict[str, Any]] = field(default_factory=list)
     supports_messages: bool = False
+    supports_concurrent_calls: bool = False
+
+    def __post_init__(self) -> None:
+        self.responses = deque(self.responses)
+        self.role_responses = {
+            role: deque(responses) for role, responses in self.role_responses.items()
+        }
 
     def complete(self, prompt: str, params: dict[str, Any] | None = None) -> str:
-        payload = {"prompt": prompt, "params": params or {}}
-        self.calls.append(payload)
-        role = payload["params"].get("role")
-        if role and role in self.role_responses and self.role_responses[role]:
-            response = self.role_responses[role].pop(0)
-            return _render_response(response, prompt)
+        params = params or {}
+        self.calls.append({"prompt": prompt, "params": params})
+        role = params.get("role")
+        if role:
+            role_queue = self.role_responses.get(role)
+            if role_queue:
+                return _render_response(role_queue.popleft(), prompt)
         if self.responses:
-            response = self.responses.pop(0)
+            response = self.responses.popleft()
             return _render_response(response, prompt)
         return ""
 
@@ -33,35 +43,34 @@ class FakeBackend:
         self.responses.extend(responses)
 
     def set_responses(self, responses: Iterable[str]) -> None:
-        self.responses = list(responses)
+        self.responses = deque(responses)
 
     def extend_role_responses(self, role: str, responses: Iterable[str]) -> None:
-        self.role_responses.setdefault(role, []).extend(responses)
+        self.role_responses.setdefault(role, deque()).extend(responses)
 
     def set_role_responses(self, role: str, responses: Iterable[str]) -> None:
-        self.role_responses[role] = list(responses)
+        self.role_responses[role] = deque(responses)
 
 
 def _render_response(response: str, prompt: str) -> str:
-    if not isinstance(response, str):
-        return response
-    if "{{TOOL_OUTPUT}}" not in response:
+    if not isinstance(response, str) or _TOOL_OUTPUT_PLACEHOLDER not in response:
         return response
     tool_output = _select_tool_output(_extract_tool_results(prompt))
-    return response.replace("{{TOOL_OUTPUT}}", tool_output)
+    return response.replace(_TOOL_OUTPUT_PLACEHOLDER, tool_output)
 
 
 def _extract_tool_results(prompt: str) -> list[dict[str, Any]]:
-    start = prompt.find(_TOOL_RESULTS_MARKER)
-    if start == -1:
+    # Tool results are appended after the original prompt, so search from the end.
+    _, marker, tail = prompt.rpartition(_TOOL_RESULTS_MARKER)
+    if not marker:
         return []
-    tail = prompt[start + len(_TOOL_RESULTS_MARKER):]
     results: list[dict[str, Any]] = []
     for line in tail.splitlines():
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped.startswith("{"):
             continue
         try:
-            payload = json.loads(line)
+            payload = json.loads(stripped)
         except json.JSONDecodeError:
             continue
         if isinstance(payload, dict):
@@ -99,24 +108,25 @@ def _load_env_json_role_map(env_value: str) -> dict[str, list[str]]:
     data = json.loads(env_value)
     if not isinstance(data, dict):
         raise ValueError("fake role responses must be a JSON object")
-    role_responses: dict[str, list[str]] = {}
-    for role, responses in data.items():
-        if not isinstance(role, str) or not isinstance(responses, list):
+    # JSON object keys are always strings and json.loads builds fresh lists,
+    # so only the values need checking and they can be returned as-is.
+    for responses in data.values():
+        if not isinstance(responses, list) or not all(
+            isinstance(item, str) for item in responses
+        ):
             raise ValueError("fake role responses must map role -> list[str]")
-        if not all(isinstance(item, str) for item in responses):
-            raise ValueError("fake role responses must map role -> list[str]")
-        role_responses[role] = list(responses)
-    return role_responses
+    return data
 
 
 def _factory(**_kwargs: Any) -> "FakeBackend":
     backend = FakeBackend()
     responses_json = os.getenv("SPECTATOR_FAKE_RESPONSES")
     if responses_json:
-        backend.responses = _load_env_json_list(responses_json)
+        backend.set_responses(_load_env_json_list(responses_json))
     role_responses_json = os.getenv("SPECTATOR_FAKE_ROLE_RESPONSES")
     if role_responses_json:
-        backend.role_responses = _load_env_json_role_map(role_responses_json)
+        for role, responses in _load_env_json_role_map(role_responses_json).items():
+            backend.set_role_responses(role, responses)
     return backend
 
 
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 import logging
 import os
+import threading
 import time
+import urllib.error
+import urllib.parse
 import urllib.request
+from contextlib import contextmanager
+from http.client import HTTPConnection, HTTPResponse, HTTPSConnection
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Any, Iterable, Iterator
@@ -18,19 +25,29 @@ _ENV_LLAMA_RULES_PROMPT = "SPECTATOR_LLAMA_RULES_PROMPT"
 _ENV_LLAMA_LOG_PAYLOAD = "SPECTATOR_LLAMA_LOG_PAYLOAD"
 _ENV_LLAMA_LOG_DIR = "SPECTATOR_LLAMA_LOG_DIR"
 
+_LOG_SEQ = itertools.count()
+
+
+def _llama_rules_path() -> str:
+    return os.getenv(_ENV_LLAMA_RULES_PROMPT, _DEFAULT_LLAMA_RULES_PROMPT)
+
 
 def _load_llama_rules() -> str:
-    rel_path = os.getenv(_ENV_LLAMA_RULES_PROMPT, _DEFAULT_LLAMA_RULES_PROMPT)
-    return load_prompt(rel_path)
+    return load_prompt(_llama_rules_path())
 
 
-def _build_system_rules(model: str | None) -> str:
+@functools.lru_cache(maxsize=8)
+def _compose_system_rules(rules_path: str, model: str | None) -> str:
     model_line = (
         f"The underlying model is {model}."
         if model
         else "The underlying model is unknown."
     )
-    return f"{_load_llama_rules()} {model_line}"
+    return f"{load_prompt(rules_path)} {model_line}"
+
+
+def _build_system_rules(model: str | None) -> str:
+    return _compose_system_rules(_llama_rules_path(), model)
 
 
 def build_system_rules(model: str | None) -> str:
@@ -64,6 +81,132 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
+# Base rules lead the system message, so cache_prompt lets the server reuse their KV cache.
+_PAYLOAD_DEFAULTS: dict[str, Any] = {
+    "temperature": 0,
+    "top_p": 1,
+    "max_tokens": 512,
+    "seed": 7,
+    "cache_prompt": True,
+}
+# Params consumed by the backend itself rather than forwarded to llama-server.
+_CLIENT_ONLY_PARAMS = frozenset({"role", "stream_callback", "system_prompt", "messages", "model"})
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_POOL_MAXSIZE = 8
+_STREAM_READ_BYTES = 65536
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections to a single llama-server origin."""
+
+    __slots__ = ("_https", "_host", "_port", "_prefix", "_base", "_proxied", "_idle", "_lock")
+
+    def __init__(self, base_url: str) -> None:
+        parts = urllib.parse.urlsplit(base_url)
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._base = urllib.parse.urlunsplit((parts.scheme, parts.netloc, self._prefix, "", ""))
+        # Pooled connections go straight to the origin and do not follow redirects.
+        # Origins routed through HTTP(S)_PROXY (minus NO_PROXY) keep using urlopen.
+        proxies = urllib.request.getproxies()
+        self._proxied = parts.scheme in proxies and not urllib.request.proxy_bypass(self._host)
+        self._idle: list[HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self, timeout_s: float) -> HTTPConnection | None:
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is not None:
+            conn.timeout = timeout_s
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout_s)
+        return conn
+
+    def _release(self, conn: HTTPConnection, response: HTTPResponse) -> None:
+        if response.isclosed() and not response.will_close:
+            with self._lock:
+                if len(self._idle) < _POOL_MAXSIZE:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    @contextmanager
+    def post(
+        self,
+        path: str,
+        body: bytes,
+        headers: dict[str, str],
+        timeout_s: float,
+    ) -> Iterator[HTTPResponse]:
+        if self._proxied:
+            request = urllib.request.Request(
+                self._base + path, data=body, headers=headers, method="POST"
+            )
+            with urllib.request.urlopen(request, timeout=timeout_s) as response:
+                yield response
+            return
+        url = self._prefix + path
+        conn = self._acquire(timeout_s)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                connection_cls = HTTPSConnection if self._https else HTTPConnection
+                conn = connection_cls(self._host, self._port, timeout=timeout_s)
+            try:
+                conn.request("POST", url, body=body, headers=headers)
+                response = conn.getresponse()
+                break
+            except ConnectionError:
+                conn.close()
+                # The server may have dropped an idle keep-alive socket; retry once
+                # on a fresh connection before giving up.
+                if not reused:
+                    raise
+                conn = None
+                reused = False
+            except BaseException:
+                conn.close()
+                raise
+        try:
+            if response.status >= 400:
+                raise urllib.error.HTTPError(
+                    self._base + path, response.status, response.reason, response.headers, response
+                )
+            yield response
+        except BaseException:
+            conn.close()
+            raise
+        self._release(conn, response)
+
+
+_POOLS: dict[str, _ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(base_url: str) -> _ConnectionPool:
+    pool = _POOLS.get(base_url)
+    if pool is not None:
+        return pool
+    with _POOLS_LOCK:
+        pool = _POOLS.get(base_url)
+        if pool is None:
+            pool = _POOLS[base_url] = _ConnectionPool(base_url)
+        return pool
+
+
+def _clear_pools() -> None:
+    _POOLS.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    # Pooled sockets are shared with the parent after fork; children start fresh.
+    os.register_at_fork(after_in_child=_clear_pools)
+
+
 @dataclass(slots=True)
 class LlamaServerBackend:
     base_url: str = os.getenv("LLAMA_SERVER_BASE_URL", "http://127.0.0.1:8080")
@@ -71,40 +214,16 @@ class LlamaServerBackend:
     api_key: str | None = os.getenv("LLAMA_SERVER_API_KEY")
     model: str | None = os.getenv("LLAMA_SERVER_MODEL")
     supports_messages: bool = True
+    supports_concurrent_calls: bool = True
     reset_slot: bool = _env_bool("LLAMA_SERVER_RESET_SLOT", False)
     slot_id: int = _env_int("LLAMA_SERVER_SLOT_ID", 0)
     _reset_run_ids: set[str] = field(default_factory=set, init=False, repr=False)
 
     def _headers(self) -> dict[str, str]:
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
-
-    '''
-    def _build_payload(self, prompt: str, params: dict[str, Any]) -> dict[str, Any]:
-        options = dict(params)
-        options.pop("role", None)
-        options.pop("stream_callback", None)
-        messages = options.pop("messages", None)
-        model = options.pop("model", self.model)
-        options.setdefault("temperature", 0)
-        options.setdefault("top_p", 1)
-        options.setdefault("max_tokens", 512)
-        options.setdefault("seed", 7)
-        if messages is None:
-            messages = [
-                {"role": "system", "content": _build_system_rules(model)},
-                {"role": "user", "content": prompt},
-            ]
-        payload = {"messages": messages}
-        if model:
-            payload["model"] = model
-        if "cache_prompt" not in options:
-            payload["cache_prompt"] = False
-        payload.update(options)
-        return payload
-    '''
+        # Shared when there is no API key; http.client only reads the mapping.
+        if not self.api_key:
+            return _JSON_HEADERS
+        return {**_JSON_HEADERS, "Authorization": f"Bearer {self.api_key}"}
 
     def _ensure_system_rules(
         self,
@@ -114,6 +233,10 @@ class LlamaServerBackend:
         for i, msg in enumerate(messages):
             if isinstance(msg, dict) and msg.get("role") == "system":
                 content = msg.get("content")
+                if isinstance(content, str) and content.startswith(system_text):
+                    # Already carries the rules (e.g. built by the pipeline); prefixing
+                    # them again would only grow the cached prompt prefix.
+                    return messages
                 if isinstance(content, str) and content.strip():
                     messages[i] = {"role": "system", "content": f"{system_text}\n\n{content}"}
                 else:
@@ -121,94 +244,37 @@ class LlamaServerBackend:
                 return messages
         return [{"role": "system", "content": system_text}, *messages]
 
-    def _ensure_system_rules(
-        self,
-        messages: list[dict[str, Any]],
-        system_text: str,
-    ) -> list[dict[str, Any]]:
-        for i, msg in enumerate(messages):
-            if isinstance(msg, dict) and msg.get("role") == "system":
-                content = msg.get("content")
-                if isinstance(content, str) and content.strip():
-                    messages[i] = {"role": "system", "content": f"{system_text}\n\n{content}"}
-                else:
-                    messages[i] = {"role": "system", "content": system_text}
-                return messages
-        return [{"role": "system", "content": system_text}, *messages]
-
-
     def _build_payload(self, prompt: str, params: dict[str, Any]) -> dict[str, Any]:
-        options = dict(params)
-        options.pop("role", None)
-        options.pop("stream_callback", None)
-
-        # NEW: accept upstream system_prompt
-        upstream_system = options.pop("system_prompt", None)
+        # Accept an upstream system_prompt
+        upstream_system = params.get("system_prompt")
         if upstream_system is not None and not isinstance(upstream_system, str):
             upstream_system = str(upstream_system)
 
-        messages = options.pop("messages", None)
-        model = options.pop("model", self.model)
-
-        options.setdefault("temperature", 0)
-        options.setdefault("top_p", 1)
-        options.setdefault("max_tokens", 512)
-        options.setdefault("seed", 7)
+        messages = params.get("messages")
+        model = params.get("model", self.model)
 
         # Base rules always exist
         base_rules = _build_system_rules(model)
         merged_system = base_rules if not upstream_system else f"{base_rules}\n\n{upstream_system}"
 
         if messages is None:
-            messages = [{"role": "user", "content": prompt}]
-
-        # Ensure system is present / prefixed
-        messages = self._ensure_system_rules(messages, merged_system)
-
-        payload = {"messages": messages}
-        if model:
-            payload["model"] = model
-        payload.setdefault("cache_prompt", False)
-        payload.update(options)
-        return payload
-
-    def _build_payload(self, prompt: str, params: dict[str, Any]) -> dict[str, Any]:
-        options = dict(params)
-        options.pop("role", None)
-        options.pop("stream_callback", None)
-
-        # NEW: accept upstream system_prompt
-        upstream_system = options.pop("system_prompt", None)
-        if upstream_system is not None and not isinstance(upstream_system, str):
-            upstream_system = str(upstream_system)
-
-        messages = options.pop("messages", None)
-        model = options.pop("model", self.model)
-
-        options.setdefault("temperature", 0)
-        options.setdefault("top_p", 1)
-        options.setdefault("max_tokens", 512)
-        options.setdefault("seed", 7)
-
-        # Base rules always exist
-        base_rules = _build_system_rules(model)
-        merged_system = base_rules if not upstream_system else f"{base_rules}\n\n{upstream_system}"
-
-        if messages is None:
-            messages = [{"role": "user", "content": prompt}]
-
-        # Ensure system is present / prefixed
-        messages = self._ensure_system_rules(messages, merged_system)
+            messages = [
+                {"role": "system", "content": merged_system},
+                {"role": "user", "content": prompt},
+            ]
+        else:
+            # Ensure system is present / prefixed
+            messages = self._ensure_system_rules(messages, merged_system)
 
         payload = {"messages": messages}
         if model:
             payload["model"] = model
-        payload.setdefault("cache_prompt", False)
-        payload.update(options)
+        payload.update(_PAYLOAD_DEFAULTS)
+        for key, value in params.items():
+            if key not in _CLIENT_ONLY_PARAMS:
+                payload[key] = value
         return payload
 
-
-
     @staticmethod
     def _extract_content(data: dict[str, Any]) -> str:
         choices = data.get("choices")
@@ -227,13 +293,38 @@ class LlamaServerBackend:
         return ""
 
     @staticmethod
-    def _iter_sse_lines(lines: Iterable[str]) -> Iterable[str]:
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            if stripped.startswith("data:"):
-                yield stripped[len("data:") :].strip()
+    def _extract_delta(chunk: Any) -> str:
+        if not isinstance(chunk, dict):
+            return ""
+        choices = chunk.get("choices")
+        if not isinstance(choices, list) or not choices:
+            return ""
+        first = choices[0]
+        if not isinstance(first, dict):
+            return ""
+        message = first.get("delta")
+        if isinstance(message, dict):
+            content = message.get("content")
+            return content if isinstance(content, str) else ""
+        text = first.get("text")
+        return text if isinstance(text, str) else ""
+
+    @staticmethod
+    def _iter_sse_data(chunks: Iterable[bytes]) -> Iterator[str]:
+        # Chunks are split wherever the socket read ended, so carry the partial last
+        # line over. Only data payloads are decoded; "\n" never occurs inside a UTF-8
+        # multi-byte sequence, so splitting the raw bytes is safe.
+        pending = b""
+        for chunk in chunks:
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                stripped = line.strip()
+                if stripped.startswith(b"data:"):
+                    yield stripped[5:].strip().decode("utf-8")
+        stripped = pending.strip()
+        if stripped.startswith(b"data:"):
+            yield stripped[5:].strip().decode("utf-8")
 
     @staticmethod
     def _log_payload(payload: dict[str, Any]) -> None:
@@ -244,32 +335,25 @@ class LlamaServerBackend:
         if log_dir:
             log_path = Path(log_dir)
             log_path.mkdir(parents=True, exist_ok=True)
-            pid = os.getpid()
-            for _ in range(5):
-                timestamp = time.time_ns()
-                filename = f"llama_payload_{timestamp}_{pid}.json"
-                payload_path = log_path / filename
-                try:
-                    with payload_path.open("x", encoding="utf-8") as handle:
-                        handle.write(pretty_payload)
-                    return
-                except FileExistsError:
-                    continue
-            logging.getLogger(__name__).warning(
-                "Failed to write llama payload log after multiple attempts."
-            )
+            # The pid and per-process sequence make names unique by construction; the
+            # timestamp keeps them in time order and apart across pid reuse.
+            filename = f"llama_payload_{time.time_ns()}_{os.getpid()}_{next(_LOG_SEQ)}.json"
+            try:
+                with (log_path / filename).open("x", encoding="utf-8") as handle:
+                    handle.write(pretty_payload)
+            except FileExistsError:
+                logging.getLogger(__name__).warning(
+                    "Llama payload log %s already exists; skipping.", filename
+                )
             return
         logging.getLogger(__name__).info("Llama request payload:\n%s", pretty_payload)
 
-    def _open_stream(self, url: str, payload: dict[str, Any]) -> Iterator[str]:
+    def _open_stream(self, path: str, payload: dict[str, Any]) -> Iterator[bytes]:
         data = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(url, data=data, headers=self._headers(), method="POST")
-        response = urllib.request.urlopen(request, timeout=self.timeout_s)
-        try:
-            for raw_line in response:
-                yield raw_line.decode("utf-8")
-        finally:
-            response.close()
+        pool = _get_pool(self.base_url)
+        with pool.post(path, data, self._headers(), self.timeout_s) as response:
+            while chunk := response.read1(_STREAM_READ_BYTES):
+                yield chunk
 
     def reset_slot_cache(self, run_id: str | None = None, tracer=None) -> None:
         if not self.reset_slot:
@@ -278,11 +362,11 @@ class LlamaServerBackend:
         if token in self._reset_run_ids:
             return
         self._reset_run_ids.add(token)
-        url = f"{self.base_url.rstrip('/')}/slots/{self.slot_id}?action=erase"
+        path = f"/slots/{self.slot_id}?action=erase"
         try:
-            request = urllib.request.Request(url, data=b"", headers=self._headers(), method="POST")
-            with urllib.request.urlopen(request, timeout=self.timeout_s):
-                return
+            pool = _get_pool(self.base_url)
+            with pool.post(path, b"", self._headers(), self.timeout_s) as response:
+                response.read()
         except Exception as exc:  # noqa: BLE001
             if tracer is not None:
                 tracer.write(
@@ -303,40 +387,42 @@ class LlamaServerBackend:
         self._log_payload(payload)
         stream = bool(payload.get("stream"))
         stream_callback = params.get("stream_callback")
-        url = f"{self.base_url.rstrip('/')}/v1/chat/completions"
+        path = "/v1/chat/completions"
 
         if not stream:
             data = json.dumps(payload).encode("utf-8")
-            request = urllib.request.Request(url, data=data, headers=self._headers(), method="POST")
-            with urllib.request.urlopen(request, timeout=self.timeout_s) as response:
-                body = response.read().decode("utf-8")
+            pool = _get_pool(self.base_url)
+            with pool.post(path, data, self._headers(), self.timeout_s) as response:
+                body = response.read()
             return self._extract_content(json.loads(body))
 
+        callback = stream_callback if callable(stream_callback) else None
         raw_parts: list[str] = []
-        for data in self._iter_sse_lines(self._open_stream(url, payload)):
+        for data in self._iter_sse_data(self._open_stream(path, payload)):
             if data == "[DONE]":
                 break
+            # Completion chunks are JSON objects; skip keep-alives and other non-object
+            # payloads without raising and catching a decode error.
+            if not data.endswith("}"):
+                continue
             try:
-                payload = json.loads(data)
+                chunk = json.loads(data)
             except json.JSONDecodeError:
                 continue
-            delta = ""
-            choices = payload.get("choices")
-            if isinstance(choices, list) and choices:
-                first = choices[0]
-                if isinstance(first, dict):
-                    message = first.get("delta")
-                    if isinstance(message, dict):
-                        content = message.get("content")
-                        if isinstance(content, str):
-                            delta = content
-                    elif isinstance(first.get("text"), str):
-                        delta = first["text"]
+            delta = self._extract_delta(chunk)
             if delta:
                 raw_parts.append(delta)
-                if callable(stream_callback):
-                    stream_callback(delta)
+                if callback is not None:
+                    callback(delta)
         return "".join(raw_parts)
 
+    async def acomplete(self, prompt: str, params: dict[str, Any] | None = None) -> str:
+        # Runs the blocking request on a worker thread; the connection pool hands each
+        # concurrent call its own socket, so gathered calls overlap on the network.
+        # A stream_callback, if given, is invoked from that worker thread.
+        import asyncio  # Deferred: importing asyncio costs ~25 ms and sync callers never need it.
+
+        return await asyncio.to_thread(self.complete, prompt, params)
+
 
 register_backend("llama", LlamaServerBackend)
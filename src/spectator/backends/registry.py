@@ -10,13 +10,16 @@ class Backend(Protocol):
 
 
 _BACKENDS: dict[str, Callable[..., Backend]] = {}
+_SORTED_NAMES: tuple[str, ...] | None = None
 
 
 def register_backend(name: str, factory: Callable[..., Backend]) -> None:
+    global _SORTED_NAMES
     key = name.lower()
     if key in _BACKENDS:
         raise ValueError(f"Backend '{name}' is already registered")
     _BACKENDS[key] = factory
+    _SORTED_NAMES = None
 
 
 def get_backend(name: str, **kwargs: Any) -> Backend:
@@ -29,4 +32,7 @@ def get_backend(name: str, **kwargs: Any) -> Backend:
 
 
 def list_backends() -> list[str]:
-    return sorted(_BACKENDS)
+    global _SORTED_NAMES
+    if _SORTED_NAMES is None:
+        _SORTED_NAMES = tuple(sorted(_BACKENDS))
+    return list(_SORTED_NAMES)
@@ -8,14 +8,6 @@ from typing import Any
 
 from spectator.backends import get_backend, list_backends
 from spectator.backends.fake import FakeBackend
-from spectator.analysis.autopsy import autopsy_from_trace, render_autopsy_markdown
-from spectator.analysis.introspection import (
-    list_repo_files,
-    read_repo_file_tail,
-    resolve_repo_root,
-    summarize_repo_file,
-)
-from spectator.runtime import controller
 from spectator.runtime.tool_calls import END_MARKER, START_MARKER
 
 
@@ -65,6 +57,8 @@ def _build_backend(args: argparse.Namespace):
 
 
 def _run_command(args: argparse.Namespace) -> int:
+    from spectator.runtime import controller
+
     backend = _build_backend(args)
     final_text = controller.run_turn(args.session, args.text, backend)
     print(final_text)
@@ -72,6 +66,8 @@ def _run_command(args: argparse.Namespace) -> int:
 
 
 def _repl_command(args: argparse.Namespace) -> int:
+    from spectator.runtime import controller
+
     backend = _build_backend(args)
     session_id = args.session
     while True:
@@ -89,6 +85,8 @@ def _repl_command(args: argparse.Namespace) -> int:
 
 
 def _smoke_command(args: argparse.Namespace) -> int:
+    from spectator.runtime import controller
+
     session_id = args.session
     base_dir = Path("data") / "smoke"
     sandbox_root = base_dir / "sandbox"
@@ -116,6 +114,8 @@ def _resolve_data_root() -> Path:
 
 
 def _autopsy_command(args: argparse.Namespace) -> int:
+    from spectator.analysis.autopsy import autopsy_from_trace, render_autopsy_markdown
+
     data_root = _resolve_data_root()
     trace_path: Path | None = None
     checkpoint_path: Path | None = None
@@ -152,6 +152,13 @@ def _autopsy_command(args: argparse.Namespace) -> int:
 
 
 def _introspect_command(args: argparse.Namespace) -> int:
+    from spectator.analysis.introspection import (
+        list_repo_files,
+        read_repo_file_tail,
+        resolve_repo_root,
+        summarize_repo_file,
+    )
+
     repo_root = resolve_repo_root()
     data_root = _resolve_data_root()
     if args.list:
@@ -18,30 +18,40 @@ class TelemetrySnapshot:
     notes: dict[str, Any] = field(default_factory=dict)
 
 
+_MEMINFO_PATH = "/proc/meminfo"
+_MEMINFO_READ_BYTES = 4096
+_TOTAL_MB: int | None = None
+
+
+def _meminfo_field_kb(buf: bytes, label: bytes) -> int | None:
+    start = buf.find(label)
+    if start < 0:
+        return None
+    start += len(label)
+    end = buf.find(b"kB", start)
+    if end < 0:
+        end = buf.find(b"\n", start)
+    try:
+        return int(buf[start:end] if end >= 0 else buf[start:])
+    except ValueError:
+        return None
+
+
 def _read_meminfo_mb() -> tuple[int | None, int | None]:
+    global _TOTAL_MB
     try:
-        with open("/proc/meminfo", "r", encoding="utf-8") as handle:
-            meminfo = handle.read().splitlines()
+        with open(_MEMINFO_PATH, "rb") as handle:
+            buf = handle.read(_MEMINFO_READ_BYTES)
     except OSError:
         return None, None
 
-    total_kb = None
-    avail_kb = None
-    for line in meminfo:
-        if line.startswith("MemTotal:"):
-            parts = line.split()
-            if len(parts) >= 2:
-                total_kb = int(parts[1])
-        elif line.startswith("MemAvailable:"):
-            parts = line.split()
-            if len(parts) >= 2:
-                avail_kb = int(parts[1])
-        if total_kb is not None and avail_kb is not None:
-            break
-
-    total_mb = total_kb // 1024 if total_kb is not None else None
+    if _TOTAL_MB is None:
+        total_kb = _meminfo_field_kb(buf, b"MemTotal:")
+        if total_kb is not None:
+            _TOTAL_MB = total_kb // 1024
+    avail_kb = _meminfo_field_kb(buf, b"MemAvailable:")
     avail_mb = avail_kb // 1024 if avail_kb is not None else None
-    return total_mb, avail_mb
+    return _TOTAL_MB, avail_mb
 
 
 def collect_basic_telemetry() -> TelemetrySnapshot:
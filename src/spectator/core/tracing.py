@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
+import threading
+from dataclasses import asdict, dataclass, field, is_dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, TextIO
 
 
 @dataclass(slots=True)
@@ -13,13 +14,37 @@ class TraceEvent:
     data: dict[str, Any] = field(default_factory=dict)
 
 
+def _json_default(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _event_line(event: TraceEvent) -> str:
+    # Serialise the fields directly instead of deep-copying through asdict(); nested
+    # dataclasses in data are still converted via the default hook.
+    payload = {"ts": event.ts, "kind": event.kind, "data": event.data}
+    return json.dumps(payload, ensure_ascii=False, default=_json_default) + "\n"
+
+
 class TraceWriter:
     def __init__(
-        self, session_id: str, base_dir: Path | None = None, run_id: str | None = None
+        self,
+        session_id: str,
+        base_dir: Path | None = None,
+        run_id: str | None = None,
+        *,
+        keep_open: bool = False,
     ) -> None:
         self.session_id = session_id
         self.base_dir = base_dir or Path("data") / "traces"
         self.run_id = run_id
+        # Reuse one handle across writes; the owner must call close() or use `with`.
+        self.keep_open = keep_open
+        self._lock = threading.Lock()
+        self._handle: TextIO | None = None
+        self._handle_path: Path | None = None
+        self._written_path: Path | None = None
 
     @property
     def path(self) -> Path:
@@ -27,9 +52,51 @@ class TraceWriter:
             return self.base_dir / f"{self.session_id}.jsonl"
         return self.base_dir / f"{self.session_id}__{self.run_id}.jsonl"
 
+    @property
+    def wrote_any(self) -> bool:
+        return self._written_path is not None and self._written_path == self.path
+
     def write(self, event: TraceEvent) -> Path:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = json.dumps(asdict(event), ensure_ascii=False)
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(payload + "\n")
-        return self.path
+        return self._append(_event_line(event))
+
+    def write_many(self, events: Iterable[TraceEvent]) -> Path:
+        lines = [_event_line(event) for event in events]
+        if not lines:
+            return self.path
+        return self._append("".join(lines))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+                self._handle_path = None
+
+    def __enter__(self) -> TraceWriter:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _append(self, text: str) -> Path:
+        path = self.path
+        if not self.keep_open:
+            with self._lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("a", encoding="utf-8") as handle:
+                    handle.write(text)
+                self._written_path = path
+            return path
+        with self._lock:
+            handle = self._handle
+            if handle is None or self._handle_path != path:
+                if handle is not None:
+                    handle.close()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                handle = self._handle = path.open("a", encoding="utf-8")
+                self._handle_path = path
+            handle.write(text)
+            self._written_path = path
+            # Flush per call so readers tailing the trace see complete lines.
+            handle.flush()
+        return path
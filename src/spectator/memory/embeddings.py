@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import math
+import struct
 from typing import Protocol
 
 
@@ -10,34 +11,34 @@ class Embedder(Protocol):
         ...
 
 
+_DIGEST_WORDS = hashlib.sha256().digest_size // 4
+
+
 class HashEmbedder:
     def __init__(self, dim: int = 128) -> None:
         if dim <= 0:
             raise ValueError("dim must be positive")
         self.dim = dim
+        self._blocks = -(-dim // _DIGEST_WORDS)
+        self._unpack_words = struct.Struct(f">{dim}I").unpack_from
 
     def embed(self, texts: list[str]) -> list[list[float]]:
         return [self._embed_one(text) for text in texts]
 
     def _embed_one(self, text: str) -> list[float]:
-        values: list[float] = []
-        counter = 0
-        while len(values) < self.dim:
-            digest = hashlib.sha256(f"{text}|{counter}".encode("utf-8")).digest()
-            for idx in range(0, len(digest), 4):
-                chunk = digest[idx : idx + 4]
-                if len(chunk) < 4:
-                    continue
-                number = int.from_bytes(chunk, "big", signed=False)
-                values.append(number / 2**32)
-                if len(values) >= self.dim:
-                    break
-            counter += 1
-        return _normalize(values)
+        # Block i is sha256(f"{text}|{i}"); hash the shared prefix once and extend copies.
+        prefix = hashlib.sha256(f"{text}|".encode("utf-8"))
+        digests: list[bytes] = []
+        for counter in range(self._blocks):
+            block = prefix.copy()
+            block.update(str(counter).encode("ascii"))
+            digests.append(block.digest())
+        words = self._unpack_words(b"".join(digests))
+        return _normalize([word / 2**32 for word in words])
 
 
 def _normalize(values: list[float]) -> list[float]:
-    norm = math.sqrt(sum(value * value for value in values))
+    norm = math.sqrt(math.sumprod(values, values))
     if norm == 0:
         return [0.0 for _ in values]
     return [value / norm for value in values]
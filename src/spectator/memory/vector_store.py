@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import heapq
 import json
 import math
 import sqlite3
 from array import array
+from contextlib import closing, contextmanager
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
+
+# Stays well under SQLite's bound-parameter limit for large top_k values.
+_FETCH_BATCH = 500
 
 
 @dataclass(slots=True)
@@ -23,8 +29,14 @@ class SQLiteVectorStore:
         self.path = path
         self.init()
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # sqlite3's own context manager only commits; closing() releases the handle too.
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            yield conn
+
     def init(self) -> None:
-        with sqlite3.connect(self.path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS memory_records (
@@ -42,39 +54,47 @@ class SQLiteVectorStore:
                     record_id TEXT PRIMARY KEY,
                     dim INTEGER NOT NULL,
                     vector BLOB NOT NULL,
+                    norm REAL,
                     FOREIGN KEY(record_id) REFERENCES memory_records(id)
                 )
                 """
             )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(memory_vectors)")}
+            if "norm" not in columns:
+                # Stores created before norms were persisted; their rows keep NULL and
+                # are normalised at query time.
+                conn.execute("ALTER TABLE memory_vectors ADD COLUMN norm REAL")
 
     def add(self, records: Iterable[MemoryRecord], vectors: Iterable[list[float]]) -> None:
         record_list = list(records)
         vector_list = list(vectors)
         if len(record_list) != len(vector_list):
             raise ValueError("records and vectors length mismatch")
-        with sqlite3.connect(self.path) as conn:
-            for record, vector in zip(record_list, vector_list):
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO memory_records (id, ts, text, tags, meta)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record.id,
-                        record.ts,
-                        record.text,
-                        json.dumps(record.tags),
-                        json.dumps(record.meta),
-                    ),
-                )
-                blob = _pack_vector(vector)
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO memory_vectors (record_id, dim, vector)
-                    VALUES (?, ?, ?)
-                    """,
-                    (record.id, len(vector), blob),
-                )
+        record_rows = [
+            (record.id, record.ts, record.text, json.dumps(record.tags), json.dumps(record.meta))
+            for record in record_list
+        ]
+        vector_rows = []
+        for record, vector in zip(record_list, vector_list):
+            blob = _pack_vector(vector)
+            # Norm of the stored float32 values, matching what query() unpacks.
+            norm = _vector_norm(_unpack_vector(blob, len(vector)))
+            vector_rows.append((record.id, len(vector), blob, norm))
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO memory_records (id, ts, text, tags, meta)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                record_rows,
+            )
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO memory_vectors (record_id, dim, vector, norm)
+                VALUES (?, ?, ?, ?)
+                """,
+                vector_rows,
+            )
 
     def query(self, vector: list[float], top_k: int = 5) -> list[tuple[MemoryRecord, float]]:
         if top_k <= 0:
@@ -82,31 +102,51 @@ class SQLiteVectorStore:
         query_norm = _vector_norm(vector)
         if query_norm == 0:
             return []
-        results: list[tuple[MemoryRecord, float]] = []
-        with sqlite3.connect(self.path) as conn:
+        scored: list[tuple[str, float]] = []
+        with self._connect() as conn:
+            # Score on the vectors alone; only the winning records are loaded and decoded.
             rows = conn.execute(
                 """
-                SELECT r.id, r.ts, r.text, r.tags, r.meta, v.dim, v.vector
-                FROM memory_records r
-                JOIN memory_vectors v ON r.id = v.record_id
+                SELECT v.record_id, v.dim, v.vector, v.norm
+                FROM memory_vectors v
+                JOIN memory_records r ON r.id = v.record_id
                 """
             ).fetchall()
+            for record_id, dim, blob, norm in rows:
+                stored_vector = _unpack_vector(blob, dim)
+                if len(stored_vector) != len(vector):
+                    continue
+                if norm is None:
+                    norm = _vector_norm(stored_vector)
+                similarity = _cosine_similarity(vector, stored_vector, query_norm * norm)
+                scored.append((record_id, similarity))
+            top = heapq.nlargest(top_k, scored, key=itemgetter(1))
+            records = _fetch_records(conn, [record_id for record_id, _ in top])
+        return [
+            (records[record_id], similarity)
+            for record_id, similarity in top
+            if record_id in records
+        ]
+
+
+def _fetch_records(conn: sqlite3.Connection, record_ids: list[str]) -> dict[str, MemoryRecord]:
+    records: dict[str, MemoryRecord] = {}
+    for start in range(0, len(record_ids), _FETCH_BATCH):
+        batch = record_ids[start : start + _FETCH_BATCH]
+        placeholders = ", ".join("?" * len(batch))
+        rows = conn.execute(
+            f"SELECT id, ts, text, tags, meta FROM memory_records WHERE id IN ({placeholders})",
+            batch,
+        )
         for row in rows:
-            record = MemoryRecord(
+            records[row[0]] = MemoryRecord(
                 id=row[0],
                 ts=row[1],
                 text=row[2],
                 tags=json.loads(row[3]),
                 meta=json.loads(row[4]),
             )
-            dim = row[5]
-            stored_vector = _unpack_vector(row[6], dim)
-            if len(stored_vector) != len(vector):
-                continue
-            similarity = _cosine_similarity(vector, stored_vector, query_norm)
-            results.append((record, similarity))
-        results.sort(key=lambda item: item[1], reverse=True)
-        return results[:top_k]
+    return records
 
 
 def _pack_vector(vector: list[float]) -> bytes:
@@ -115,20 +155,18 @@ def _pack_vector(vector: list[float]) -> bytes:
 
 
 def _unpack_vector(blob: bytes, dim: int) -> list[float]:
-    data = array("f")
-    data.frombytes(blob)
+    # View the blob as float32 and convert in one C call; no intermediate array copy.
+    data = memoryview(blob).cast("f")
     if dim:
         data = data[:dim]
-    return list(data)
+    return data.tolist()
 
 
 def _vector_norm(vector: list[float]) -> float:
-    return math.sqrt(sum(value * value for value in vector))
+    return math.sqrt(math.sumprod(vector, vector))
 
 
-def _cosine_similarity(vector: list[float], stored: list[float], query_norm: float) -> float:
-    denom = query_norm * _vector_norm(stored)
+def _cosine_similarity(vector: list[float], stored: list[float], denom: float) -> float:
     if denom == 0:
         return 0.0
-    dot = sum(a * b for a, b in zip(vector, stored))
-    return dot / denom
+    return math.sumprod(vector, stored) / denom
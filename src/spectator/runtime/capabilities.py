@@ -7,6 +7,10 @@ from spectator.core.types import State
 REQUEST_PREFIX = "request_permission:"
 GRANT_PREFIX = "grant_permission:"
 
+_REQUEST = 0
+_GRANT = 1
+_ACTION_KINDS = {REQUEST_PREFIX[:-1]: _REQUEST, GRANT_PREFIX[:-1]: _GRANT}
+
 
 def _remove_value(items: Iterable[str], value: str) -> list[str]:
     return [item for item in items if item != value]
@@ -54,35 +58,45 @@ def clear_pending(state: State) -> bool:
 
 
 def apply_permission_actions(state: State, actions: Iterable[str]) -> dict[str, object]:
-    before = {
-        "granted": list(state.capabilities_granted),
-        "pending": list(state.capabilities_pending),
-    }
     applied: list[str] = []
     ignored: list[dict[str, str]] = []
+    granted_count = len(state.capabilities_granted)
+    granted = set(state.capabilities_granted)
+    pending_before = set(state.capabilities_pending)
+    pending = set(pending_before)
 
     for action in actions:
-        if action.startswith(REQUEST_PREFIX):
-            cap = action[len(REQUEST_PREFIX) :]
-            if not cap:
-                ignored.append({"action": action, "reason": "empty_capability"})
-                continue
-            if request_permission(state, cap):
-                applied.append(action)
-        elif action.startswith(GRANT_PREFIX):
-            cap = action[len(GRANT_PREFIX) :]
-            if not cap:
-                ignored.append({"action": action, "reason": "empty_capability"})
+        head, sep, cap = action.partition(":")
+        kind = _ACTION_KINDS.get(head) if sep else None
+        if kind is None:
+            ignored.append({"action": action, "reason": "unknown_action"})
+            continue
+        if not cap:
+            ignored.append({"action": action, "reason": "empty_capability"})
+            continue
+        if kind == _REQUEST:
+            if cap in granted or cap in pending:
                 continue
-            if grant_permission(state, cap):
-                applied.append(action)
+            pending.add(cap)
+            state.capabilities_pending.append(cap)
+            applied.append(action)
         else:
-            ignored.append({"action": action, "reason": "unknown_action"})
+            changed = cap in pending
+            pending.discard(cap)
+            if cap not in granted:
+                granted.add(cap)
+                state.capabilities_granted.append(cap)
+                changed = True
+            if changed:
+                applied.append(action)
 
     normalize_capabilities(state)
 
-    after = {
-        "granted": list(state.capabilities_granted),
-        "pending": list(state.capabilities_pending),
+    granted_added = state.capabilities_granted[granted_count:]
+    return {
+        "granted_added": granted_added,
+        "pending_added": [cap for cap in state.capabilities_pending if cap not in pending_before],
+        "pending_removed_by_grant": [cap for cap in granted_added if cap in pending_before],
+        "applied": applied,
+        "ignored": ignored,
     }
-    return {"before": before, "after": after, "applied": applied, "ignored": ignored}
@@ -3,13 +3,15 @@ from __future__ import annotations
 import json
 import os
 import time
-from dataclasses import asdict
+from dataclasses import fields
 from pathlib import Path
 from typing import Any
 
 from spectator.core.types import ChatMessage, Checkpoint, State
 
 DEFAULT_DIR = Path("data") / "checkpoints"
+_STATE_FIELDS = tuple(item.name for item in fields(State))
+_ENV_CHECKPOINT_FSYNC = "SPECTATOR_CHECKPOINT_FSYNC"
 
 
 def _checkpoint_path(session_id: str, base_dir: Path | None = None) -> Path:
@@ -17,18 +19,57 @@ def _checkpoint_path(session_id: str, base_dir: Path | None = None) -> Path:
     return root / f"{session_id}.json"
 
 
-def save_checkpoint(checkpoint: Checkpoint, base_dir: Path | None = None) -> Path:
+def _checkpoint_payload(checkpoint: Checkpoint) -> dict[str, Any]:
+    state = checkpoint.state
+    return {
+        "session_id": checkpoint.session_id,
+        "revision": checkpoint.revision,
+        "updated_ts": checkpoint.updated_ts,
+        "state": {name: getattr(state, name) for name in _STATE_FIELDS},
+        "recent_messages": [
+            {"role": message.role, "content": message.content}
+            for message in checkpoint.recent_messages
+        ],
+        "trace_tail": checkpoint.trace_tail,
+    }
+
+
+def _fsync_enabled() -> bool:
+    raw = os.getenv(_ENV_CHECKPOINT_FSYNC)
+    if raw is None:
+        return False
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _fsync_dir(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def save_checkpoint(
+    checkpoint: Checkpoint,
+    base_dir: Path | None = None,
+    fsync: bool | None = None,
+) -> Path:
     path = _checkpoint_path(checkpoint.session_id, base_dir)
     path.parent.mkdir(parents=True, exist_ok=True)
     checkpoint.revision += 1
     checkpoint.updated_ts = time.time()
-    payload = asdict(checkpoint)
+    payload = _checkpoint_payload(checkpoint)
     temp_path = path.with_suffix(".json.tmp")
+    if fsync is None:
+        fsync = _fsync_enabled()
     with temp_path.open("w", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, ensure_ascii=False))
-        handle.flush()
-        os.fsync(handle.fileno())
+        handle.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+        if fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
     temp_path.replace(path)
+    if fsync:
+        _fsync_dir(path.parent)
     return path
 
 
@@ -95,9 +136,11 @@ def _coerce_trace_tail(payload: Any) -> list[str]:
 
 def load_latest(session_id: str, base_dir: Path | None = None) -> Checkpoint | None:
     path = _checkpoint_path(session_id, base_dir)
-    if not path.exists():
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
         return None
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = json.loads(data)
     if not isinstance(payload, dict):
         raise ValueError("checkpoint payload must be an object")
     if not isinstance(payload.get("session_id"), str):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Iterable, TypeVar
 
@@ -41,25 +42,15 @@ class CondenseReport:
 
 
 def dedupe_preserve_order(items: Iterable[str]) -> list[str]:
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        deduped.append(item)
-    return deduped
+    return list(dict.fromkeys(items))
 
 
 def cap_tail(items: Iterable[str], max_n: int) -> list[str]:
-    materialized = list(items)
-    if max_n < 0:
+    if max_n <= 0:
         return []
-    if len(materialized) <= max_n:
-        return materialized
-    if max_n == 0:
-        return []
-    return materialized[-max_n:]
+    if isinstance(items, (list, tuple)):
+        return list(items[-max_n:])
+    return list(deque(items, maxlen=max_n))
 
 
 def truncate_text(text: str, max_chars: int) -> str:
@@ -74,7 +65,12 @@ def truncate_text(text: str, max_chars: int) -> str:
 
 
 def _condense_list(items: Iterable[str], max_items: int) -> list[str]:
-    return cap_tail(dedupe_preserve_order(items), max_items)
+    if max_items <= 0:
+        return []
+    deduped = dedupe_preserve_order(items)
+    if len(deduped) <= max_items:
+        return deduped
+    return deduped[-max_items:]
 
 
 def condense_state(state: State, policy: CondensePolicy) -> CondenseReport:
@@ -107,25 +103,11 @@ def _rebuild_role_result(result: RoleResultT, text: str) -> RoleResultT:
 
 
 def condense_upstream(results: list[RoleResultT], policy: CondensePolicy) -> list[RoleResultT]:
-    truncated_results = [
-        _rebuild_role_result(
-            result,
-            truncate_text(result.text, policy.max_upstream_chars_per_role),
-        )
-        for result in results
-    ]
-
-    total_chars = sum(len(result.text) for result in truncated_results)
-    if total_chars <= policy.max_upstream_total_chars:
-        return truncated_results
-
-    condensed: list[RoleResultT] = []
+    per_role = policy.max_upstream_chars_per_role
     remaining = policy.max_upstream_total_chars
-    for result in truncated_results:
-        text = truncate_text(result.text, remaining)
+    condensed: list[RoleResultT] = []
+    for result in results:
+        text = truncate_text(result.text, min(per_role, remaining))
         condensed.append(_rebuild_role_result(result, text))
-        remaining -= len(text)
-        if remaining <= 0:
-            remaining = 0
-
+        remaining = max(remaining - len(text), 0)
     return condensed
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from spectator.backends import get_backend
@@ -11,6 +12,23 @@ from spectator.prompts import get_role_prompt
 from spectator.runtime import checkpoints
 from spectator.runtime.pipeline import RoleSpec, run_pipeline
 from spectator.tools import build_default_registry
+from spectator.tools.executor import ToolExecutor
+
+_TRACE_TAIL_MAX = 20
+_ROLE_NAMES = ("reflection", "planner", "critic", "governor")
+
+
+@lru_cache(maxsize=1)
+def _default_roles() -> tuple[RoleSpec, ...]:
+    return tuple(
+        RoleSpec(name=name, system_prompt=get_role_prompt(name)) for name in _ROLE_NAMES
+    )
+
+
+@lru_cache(maxsize=32)
+def _default_executor(sandbox_root: Path) -> ToolExecutor:
+    _registry, executor = build_default_registry(sandbox_root)
+    return executor
 
 
 def run_turn(
@@ -32,48 +50,33 @@ def run_turn(
 
     sandbox_root = data_root / "sandbox"
     sandbox_root.mkdir(parents=True, exist_ok=True)
-    _registry, executor = build_default_registry(sandbox_root)
-
-    roles = [
-        RoleSpec(
-            name="reflection",
-            system_prompt=get_role_prompt("reflection"),
-        ),
-        RoleSpec(
-            name="planner",
-            system_prompt=get_role_prompt("planner"),
-        ),
-        RoleSpec(
-            name="critic",
-            system_prompt=get_role_prompt("critic"),
-        ),
-        RoleSpec(
-            name="governor",
-            system_prompt=get_role_prompt("governor"),
-        ),
-    ]
+    executor = _default_executor(Path(os.path.abspath(sandbox_root)))
 
     run_id = f"rev-{checkpoint.revision + 1}"
-    tracer = TraceWriter(session_id, base_dir=data_root / "traces", run_id=run_id)
-    if isinstance(backend, LlamaServerBackend):
-        backend.reset_slot_cache(run_id, tracer)
-    final_text, _results, updated_checkpoint = run_pipeline(
-        checkpoint,
-        user_text,
-        roles,
-        backend,
-        tool_executor=executor,
-        tracer=tracer,
-    )
+    with TraceWriter(
+        session_id, base_dir=data_root / "traces", run_id=run_id, keep_open=True
+    ) as tracer:
+        if isinstance(backend, LlamaServerBackend):
+            backend.reset_slot_cache(run_id, tracer)
+        final_text, _results, updated_checkpoint = run_pipeline(
+            checkpoint,
+            user_text,
+            _default_roles(),
+            backend,
+            tool_executor=executor,
+            tracer=tracer,
+        )
 
     updated_checkpoint.recent_messages.append(
         ChatMessage(role="assistant", content=final_text)
     )
-    if tracer.path.exists():
+    if tracer.wrote_any:
         trace_name = tracer.path.name
-        if trace_name not in updated_checkpoint.trace_tail:
-            updated_checkpoint.trace_tail.append(trace_name)
-        if len(updated_checkpoint.trace_tail) > 20:
-            updated_checkpoint.trace_tail = updated_checkpoint.trace_tail[-20:]
+        trace_tail = updated_checkpoint.trace_tail
+        # Run ids follow the checkpoint revision, so a repeat can only be the newest entry.
+        if not trace_tail or trace_tail[-1] != trace_name:
+            trace_tail.append(trace_name)
+        if len(trace_tail) > _TRACE_TAIL_MAX:
+            del trace_tail[:-_TRACE_TAIL_MAX]
     checkpoints.save_checkpoint(updated_checkpoint, base_dir=checkpoint_dir)
     return final_text
@@ -6,6 +6,8 @@ from typing import Any
 
 START_MARKER = "<<<NOTES_JSON>>>"
 END_MARKER = "<<<END_NOTES_JSON>>>"
+_START_LEN = len(START_MARKER)
+_END_LEN = len(END_MARKER)
 
 
 @dataclass(slots=True)
@@ -40,12 +42,12 @@ def _extract_block(text: str) -> tuple[str | None, int, int]:
     start_index = text.find(START_MARKER)
     if start_index == -1:
         return None, -1, -1
-    end_index = text.find(END_MARKER, start_index)
+    payload_start = start_index + _START_LEN
+    end_index = text.find(END_MARKER, payload_start)
     if end_index == -1:
         return None, -1, -1
-    payload_start = start_index + len(START_MARKER)
     payload = text[payload_start:end_index].strip()
-    return payload, start_index, end_index + len(END_MARKER)
+    return payload, start_index, end_index + _END_LEN
 
 
 def _coerce_patch(data: dict[str, Any]) -> NotesPatch | None:
@@ -24,7 +24,7 @@ TOOL_RESULTS_HEAD_CHARS = 6000
 TOOL_RESULTS_TAIL_CHARS = 2000
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class RoleSpec:
     name: str
     system_prompt: str
@@ -47,8 +47,10 @@ def _compact_state(state: State) -> str:
 
 
 def _extend_unique(target: list[str], values: Iterable[str]) -> None:
+    seen = set(target)
     for value in values:
-        if value not in target:
+        if value not in seen:
+            seen.add(value)
             target.append(value)
 
 
@@ -62,7 +64,8 @@ def _apply_notes_patch(state: State, patch: NotesPatch) -> None:
         remaining: list[str] = []
         for loop in state.open_loops:
             should_close = loop in close_ids
-            if not should_close:
+            # Only JSON object entries (as written by the open-loops admin) carry an id.
+            if not should_close and loop.lstrip(" \t\n\r").startswith("{"):
                 try:
                     parsed = json.loads(loop)
                 except json.JSONDecodeError:
@@ -531,20 +534,22 @@ def run_pipeline(
             )
         if patch is not None:
             _apply_notes_patch(checkpoint.state, patch)
+            action_report = None
             if patch.actions:
                 action_report = apply_permission_actions(checkpoint.state, patch.actions)
-                if tracer is not None:
-                    tracer.write(
+            report = condense_state(checkpoint.state, condense_policy)
+            last_report = report if report.trimmed else None
+            if tracer is not None:
+                patch_events: list[TraceEvent] = []
+                if action_report is not None:
+                    patch_events.append(
                         TraceEvent(
                             ts=time.time(),
                             kind="actions",
                             data={"role": role.name, "actions": patch.actions, **action_report},
                         )
                     )
-            report = condense_state(checkpoint.state, condense_policy)
-            last_report = report if report.trimmed else None
-            if tracer is not None:
-                tracer.write(
+                patch_events.append(
                     TraceEvent(
                         ts=time.time(),
                         kind="notes_patch",
@@ -552,7 +557,7 @@ def run_pipeline(
                     )
                 )
                 if report.trimmed:
-                    tracer.write(
+                    patch_events.append(
                         TraceEvent(
                             ts=time.time(),
                             kind="condense",
@@ -563,6 +568,7 @@ def run_pipeline(
                             },
                         )
                     )
+                tracer.write_many(patch_events)
         results.append(RoleResult(role=role.name, text=visible_text, notes=patch))
 
     final_text = results[-1].text if results else ""
@@ -0,0 +1,16 @@
+from spectator.backends import registry
+
+
+def test_list_backends_refreshes_after_register(monkeypatch) -> None:
+    monkeypatch.setattr(registry, "_BACKENDS", {})
+    monkeypatch.setattr(registry, "_SORTED_NAMES", None)
+
+    registry.register_backend("zeta", object)
+    assert registry.list_backends() == ["zeta"]
+
+    registry.register_backend("Alpha", object)
+    names = registry.list_backends()
+    assert names == ["alpha", "zeta"]
+
+    names.append("mutated")
+    assert registry.list_backends() == ["alpha", "zeta"]
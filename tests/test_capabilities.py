@@ -73,3 +73,44 @@ def test_grant_helper_clears_pending_match() -> None:
     assert grant_permission(state, "net")
     assert state.capabilities_granted == ["net"]
     assert state.capabilities_pending == []
+
+
+def test_actions_apply_in_order_within_one_batch() -> None:
+    state = State()
+
+    report = apply_permission_actions(
+        state,
+        ["request_permission:net", "grant_permission:net", "request_permission", "grant_permission:"],
+    )
+
+    assert state.capabilities_granted == ["net"]
+    assert state.capabilities_pending == []
+    assert report["applied"] == ["request_permission:net", "grant_permission:net"]
+    assert report["ignored"] == [
+        {"action": "request_permission", "reason": "unknown_action"},
+        {"action": "grant_permission:", "reason": "empty_capability"},
+    ]
+
+
+def test_action_report_lists_only_changes() -> None:
+    state = State(capabilities_granted=["fs"], capabilities_pending=["net", "net:example.com"])
+
+    report = apply_permission_actions(
+        state, ["grant_permission:net", "request_permission:shell", "request_permission:fs"]
+    )
+
+    assert report["granted_added"] == ["net"]
+    assert report["pending_added"] == ["shell"]
+    assert report["pending_removed_by_grant"] == ["net"]
+    assert "before" not in report
+    assert "after" not in report
+
+
+def test_action_report_ignores_stale_pending_for_earlier_grants() -> None:
+    state = State(capabilities_granted=["fs"], capabilities_pending=["fs", "net"])
+
+    report = apply_permission_actions(state, ["grant_permission:net"])
+
+    assert state.capabilities_pending == []
+    assert report["granted_added"] == ["net"]
+    assert report["pending_removed_by_grant"] == ["net"]
@@ -1,5 +1,6 @@
 import json
 import time
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
@@ -55,11 +56,12 @@ def test_checkpoint_roundtrip(tmp_path: Path) -> None:
         trace_tail=["trace.jsonl"],
     )
 
-    checkpoints.save_checkpoint(checkpoint, base_dir=tmp_path)
+    path = checkpoints.save_checkpoint(checkpoint, base_dir=tmp_path)
     loaded = checkpoints.load_latest("session-3", base_dir=tmp_path)
 
     assert loaded is not None
     assert loaded == checkpoint
+    assert json.loads(path.read_text(encoding="utf-8")) == asdict(checkpoint)
 
 
 def test_load_latest_rejects_invalid_state_types(tmp_path: Path) -> None:
@@ -86,3 +88,20 @@ def test_load_latest_rejects_invalid_state_types(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="checkpoint state field"):
         checkpoints.load_latest("session-bad", base_dir=tmp_path)
+
+
+def test_save_checkpoint_fsync_is_opt_in(tmp_path: Path, monkeypatch) -> None:
+    synced: list[int] = []
+    monkeypatch.setattr(checkpoints.os, "fsync", synced.append)
+    monkeypatch.delenv("SPECTATOR_CHECKPOINT_FSYNC", raising=False)
+    checkpoint = checkpoints.load_or_create("session-sync", base_dir=tmp_path)
+
+    checkpoints.save_checkpoint(checkpoint, base_dir=tmp_path)
+    assert synced == []
+
+    checkpoints.save_checkpoint(checkpoint, base_dir=tmp_path, fsync=True)
+    assert len(synced) == 2
+
+    monkeypatch.setenv("SPECTATOR_CHECKPOINT_FSYNC", "1")
+    checkpoints.save_checkpoint(checkpoint, base_dir=tmp_path)
+    assert len(synced) == 4
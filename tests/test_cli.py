@@ -31,20 +31,32 @@ def test_cli_run_backend_llama(monkeypatch, capsys, tmp_path) -> None:
     payload = json.dumps({"choices": [{"message": {"content": "llama-ok"}}]}).encode("utf-8")
 
     class FakeResponse:
+        status = 200
+        reason = "OK"
+        headers: dict[str, str] = {}
+        will_close = False
+
         def read(self) -> bytes:
             return payload
 
-        def __enter__(self):
-            return self
+        def isclosed(self) -> bool:
+            return True
+
+    class FakeConnection:
+        def __init__(self, host, port=None, timeout=None) -> None:
+            self.sock = None
+
+        def request(self, method, url, body=None, headers=None) -> None:
+            calls.append((method, url, body))
 
-        def __exit__(self, exc_type, exc, tb) -> bool:
-            return False
+        def getresponse(self) -> FakeResponse:
+            return FakeResponse()
 
-    def fake_urlopen(request, timeout=0):
-        calls.append(request)
-        return FakeResponse()
+        def close(self) -> None:
+            pass
 
-    monkeypatch.setattr("spectator.backends.llama_server.urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr("spectator.backends.llama_server._POOLS", {})
+    monkeypatch.setattr("spectator.backends.llama_server.HTTPConnection", FakeConnection)
 
     exit_code = cli.main(
         [
@@ -1,6 +1,7 @@
 from spectator.core.types import State
 from spectator.runtime.condense import (
     CondensePolicy,
+    cap_tail,
     condense_state,
     condense_upstream,
     truncate_text,
@@ -70,3 +71,13 @@ def test_condense_noop_below_caps() -> None:
     assert state.goals == ["g1"]
     assert report.trimmed is False
     assert condensed[0].text == "short"
+
+
+def test_cap_tail_handles_iterators_and_sequences() -> None:
+    items = ["a", "b", "c", "d"]
+
+    assert cap_tail(items, 2) == ["c", "d"]
+    assert cap_tail(tuple(items), 5) == items
+    assert cap_tail(iter(items), 3) == ["b", "c", "d"]
+    assert cap_tail(items, 0) == []
+    assert cap_tail(items, -1) == []
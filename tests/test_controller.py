@@ -53,3 +53,23 @@ def test_run_turn_appends_trace_tail_and_caps(tmp_path: Path) -> None:
         f"session-tail__rev-{rev}.jsonl" for rev in range(turns - 19, turns + 1)
     ]
     assert checkpoint.trace_tail == expected_tail
+
+
+def test_run_turn_reuses_tool_executor_per_sandbox(tmp_path: Path, monkeypatch) -> None:
+    built: list[Path] = []
+    real_build = controller.build_default_registry
+
+    def counting_build(root: Path):
+        built.append(root)
+        return real_build(root)
+
+    monkeypatch.setattr(controller, "build_default_registry", counting_build)
+    controller._default_executor.cache_clear()
+    backend = FakeBackend()
+    for role in ("reflection", "planner", "critic", "governor"):
+        backend.extend_role_responses(role, ["ok"] * 3)
+
+    for idx in range(3):
+        controller.run_turn("session-exec", f"hi {idx}", backend, base_dir=tmp_path)
+
+    assert built == [(tmp_path / "sandbox").absolute()]
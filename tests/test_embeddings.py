@@ -14,3 +14,24 @@ def test_hash_embedder_is_deterministic_and_normalized() -> None:
         norm = math.sqrt(sum(value * value for value in vector))
         assert norm > 0.0
         assert math.isclose(norm, 1.0, rel_tol=1e-6)
+
+
+def test_hash_embedder_matches_per_block_sha256() -> None:
+    import hashlib
+
+    text = "hello"
+    embedder = HashEmbedder(dim=10)
+    raw = [
+        int.from_bytes(
+            hashlib.sha256(f"{text}|{block}".encode("utf-8")).digest()[i : i + 4], "big"
+        )
+        / 2**32
+        for block in range(2)
+        for i in range(0, 32, 4)
+    ][:10]
+    norm = math.sqrt(sum(value * value for value in raw))
+
+    vector = embedder.embed([text])[0]
+
+    assert len(vector) == 10
+    assert all(math.isclose(a, b / norm, rel_tol=1e-12) for a, b in zip(vector, raw))
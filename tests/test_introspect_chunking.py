@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from spectator.analysis.chunking import chunk_file
+from spectator.analysis.chunking import chunk_file, resolve_strategy
 
 
 def test_chunk_headings_markdown() -> None:
@@ -42,6 +42,33 @@ def test_chunk_python_ast() -> None:
     assert "def qux" in titles
 
 
+def test_chunk_python_without_defs_is_single_module_chunk() -> None:
+    text = "import os\n\nVALUE = 1\n"
+    chunks = chunk_file("__init__.py", text, strategy="python_ast", max_chars=200)
+    assert [(chunk.title, chunk.start_line, chunk.end_line) for chunk in chunks] == [
+        ("module", 1, 3)
+    ]
+
+
+def test_chunk_python_without_defs_numbers_lines_like_splitlines() -> None:
+    text = "x = (\n1\n\x0c\n"
+    chunks = chunk_file("broken.py", text, strategy="python_ast", max_chars=200)
+    assert [(chunk.title, chunk.start_line, chunk.end_line) for chunk in chunks] == [
+        ("module", 1, 4)
+    ]
+
+
+def test_chunk_python_detects_defs_after_tab_or_formfeed() -> None:
+    cases = {
+        "class\tA:\n    pass\n": [("class A", 1, 2)],
+        "def\tf():\n    pass\n": [("def f", 1, 2)],
+        "\x0cdef f():\n    pass\n": [("def f", 1, 2)],
+    }
+    for text, expected in cases.items():
+        chunks = chunk_file("sample.py", text, strategy="python_ast", max_chars=200)
+        assert [(chunk.title, chunk.start_line, chunk.end_line) for chunk in chunks] == expected
+
+
 def test_chunk_oversize_function_splits() -> None:
     body = "    value = 1\n" * 200
     text = f"def big():\n{body}"
@@ -52,6 +79,16 @@ def test_chunk_oversize_function_splits() -> None:
     assert all("def big (part" in title for title in part_titles)
 
 
+def test_chunk_oversize_split_counts_lines_like_splitlines() -> None:
+    text = "intro\x0cline\n" * 12 + "# A\n" + "body\n" * 5
+    chunks = chunk_file("x.md", text, max_chars=100)
+    assert [(chunk.title, chunk.start_line, chunk.end_line) for chunk in chunks] == [
+        ("preamble (part 1/2)", 1, 18),
+        ("preamble (part 2/2)", 19, 24),
+        ("A", 25, 30),
+    ]
+
+
 def test_chunk_auto_falls_back_to_fixed() -> None:
     text = ("line\n" * 50).strip() + "\n"
     chunks_a = chunk_file("data.bin", text, strategy="auto", max_chars=50)
@@ -59,3 +96,11 @@ def test_chunk_auto_falls_back_to_fixed() -> None:
     assert chunks_a
     assert all(chunk.strategy == "fixed" for chunk in chunks_a)
     assert [chunk.id for chunk in chunks_a] == [chunk.id for chunk in chunks_b]
+
+
+def test_resolve_strategy_by_suffix() -> None:
+    assert resolve_strategy("app.LOG") == "log"
+    assert resolve_strategy("README.md") == "headings"
+    assert resolve_strategy("module.py") == "python_ast"
+    assert resolve_strategy("data.bin") == "fixed"
+    assert resolve_strategy("module.py", "Fixed") == "fixed"
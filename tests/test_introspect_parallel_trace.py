@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from spectator.analysis import introspection
+from spectator.analysis.autopsy import autopsy_from_trace
+
+
+class SlowBackend:
+    supports_concurrent_calls = True
+
+    def complete(self, prompt: str, params: dict[str, Any] | None = None) -> str:
+        time.sleep(0.02)
+        return "summary"
+
+
+def test_parallel_map_trace_passes_autopsy(tmp_path: Path, monkeypatch) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    data_root = tmp_path / "data"
+    text = "".join(f"# Section {idx}\n" + "body line\n" * 5 for idx in range(6))
+    (repo_root / "notes.md").write_text(text, encoding="utf-8")
+    monkeypatch.setattr(introspection, "get_backend", lambda _name: SlowBackend())
+
+    result = introspection.summarize_repo_file(
+        repo_root,
+        "notes.md",
+        data_root=data_root,
+        backend_name="slow",
+        chunking="headings",
+    )
+
+    assert result["chunks"] == 6
+    trace_path = data_root / "traces" / result["trace_file"]
+    kinds = [
+        json.loads(line)["kind"]
+        for line in trace_path.read_text(encoding="utf-8").splitlines()
+    ]
+    llm_kinds = [kind for kind in kinds if kind in {"llm_req", "llm_done"}]
+    assert llm_kinds == ["llm_req", "llm_done"] * 7
+    report = autopsy_from_trace(trace_path)
+    assert not [
+        anomaly
+        for anomaly in report["anomalies"]
+        if anomaly["code"] == "llm_req_done_mismatch"
+    ]
+
+
+class ScriptedBackend:
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    def complete(self, prompt: str, params: dict[str, Any] | None = None) -> str:
+        self.prompts.append(prompt)
+        time.sleep(0.005)
+        return f"summary {len(self.prompts)}"
+
+
+def test_map_calls_run_serially_without_opt_in(tmp_path: Path, monkeypatch) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    text = "".join(f"# Section {idx}\n" + "body line\n" * 5 for idx in range(4))
+    (repo_root / "notes.md").write_text(text, encoding="utf-8")
+    backend = ScriptedBackend()
+    monkeypatch.setattr(introspection, "get_backend", lambda _name: backend)
+
+    introspection.summarize_repo_file(
+        repo_root,
+        "notes.md",
+        data_root=tmp_path / "data",
+        backend_name="scripted",
+        chunking="headings",
+    )
+
+    map_prompts = backend.prompts[:4]
+    assert [f"Chunk: Section {idx}" in prompt for idx, prompt in enumerate(map_prompts)] == [
+        True
+    ] * 4
+
+
+class FailingBackend:
+    def complete(self, prompt: str, params: dict[str, Any] | None = None) -> str:
+        raise RuntimeError("backend down")
+
+
+def test_summarize_closes_trace_on_backend_error(tmp_path: Path, monkeypatch) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    (repo_root / "notes.md").write_text("# Title\nbody\n", encoding="utf-8")
+    monkeypatch.setattr(introspection, "get_backend", lambda _name: FailingBackend())
+    closed: list[Path] = []
+    real_close = introspection.TraceWriter.close
+
+    def recording_close(self) -> None:
+        closed.append(self.path)
+        real_close(self)
+
+    monkeypatch.setattr(introspection.TraceWriter, "close", recording_close)
+
+    with pytest.raises(RuntimeError, match="backend down"):
+        introspection.summarize_repo_file(
+            repo_root,
+            "notes.md",
+            data_root=tmp_path / "data",
+            backend_name="failing",
+        )
+
+    assert closed
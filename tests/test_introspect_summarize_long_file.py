@@ -23,7 +23,7 @@ def test_introspect_summarize_long_file(tmp_path: Path, monkeypatch) -> None:
     chunks = chunk_file("long.txt", text, strategy="fixed", max_chars=max_chars)
     assert len(chunks) > 1
 
-    backend = FakeBackend()
+    backend = FakeBackend(supports_concurrent_calls=False)
     backend.extend_role_responses(
         "governor",
         ["chunk summary"] * len(chunks) + ["final summary"],
@@ -3,8 +3,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from spectator.analysis import introspection
+from spectator.analysis.chunking import Chunk
 from spectator.analysis.introspection import (
     list_repo_files,
+    read_repo_file,
     read_repo_file_tail,
     summarize_repo_file,
 )
@@ -23,6 +26,16 @@ def test_introspection_list_and_read(tmp_path: Path) -> None:
     assert tail == "line2\nline3"
 
 
+def test_introspection_reads_are_capped(tmp_path: Path, monkeypatch) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    (repo_root / "big.txt").write_text("head\n" + "x" * 32 + "\ntail\n", encoding="utf-8")
+    monkeypatch.setattr(introspection, "MAX_FILE_BYTES", 8)
+
+    assert read_repo_file(repo_root, "big.txt") == "head\nxxx"
+    assert read_repo_file_tail(repo_root, "big.txt", max_lines=5) == "xx\ntail"
+
+
 def test_introspection_summarize_uses_fake_backend(tmp_path: Path, monkeypatch) -> None:
     repo_root = tmp_path / "repo"
     repo_root.mkdir()
@@ -49,3 +62,19 @@ def test_introspection_summarize_uses_fake_backend(tmp_path: Path, monkeypatch)
     assert "**Non-log Tail**" in result["summary"]
     assert "Summary here." in result["summary"]
     assert "Chunks:" in result["summary"]
+
+
+def test_build_reduce_prompt_truncates_summary_block() -> None:
+    chunks = [
+        Chunk(id=f"c{idx}", title=f"part {idx}", strategy="fixed", start_line=idx, end_line=idx, text="")
+        for idx in (1, 2)
+    ]
+
+    prompt = introspection._build_reduce_prompt(
+        "notes.md", chunks, ["a" * 200, "b" * 200], "Summarize.", max_chars=400
+    )
+
+    assert len(prompt) == 400
+    assert prompt.endswith("a\n... <truncated 251 chars>\n\nTask: Summarize.")
+    assert "Chunk 1 (part 1, lines 1-1):\naaa" in prompt
+    assert "Chunk 2" not in prompt
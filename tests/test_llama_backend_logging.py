@@ -1,27 +1,59 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import urllib.error
 
+import pytest
+
+from spectator.backends import llama_server
 from spectator.backends.llama_server import LlamaServerBackend
 
 
-def _fake_urlopen_factory(calls, response_payload: bytes):
+def _fake_connection_factory(calls, response_payload: bytes):
     class FakeResponse:
+        status = 200
+        reason = "OK"
+        headers: dict[str, str] = {}
+        will_close = False
+
         def read(self) -> bytes:
             return response_payload
 
-        def __enter__(self):
-            return self
+        def isclosed(self) -> bool:
+            return True
 
-        def __exit__(self, exc_type, exc, tb) -> bool:
-            return False
+        def close(self) -> None:
+            pass
 
-    def fake_urlopen(request, timeout=0):
-        calls.append(request)
-        return FakeResponse()
+    class FakeConnection:
+        def __init__(self, host, port=None, timeout=None) -> None:
+            self.sock = None
+
+        def request(self, method, url, body=None, headers=None) -> None:
+            calls.append({"method": method, "url": url, "body": body, "headers": headers})
+
+        def getresponse(self) -> FakeResponse:
+            return FakeResponse()
+
+        def close(self) -> None:
+            pass
+
+    return FakeConnection
+
+
+def _clear_proxy_env(monkeypatch) -> None:
+    for name in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
 
-    return fake_urlopen
+
+def _patch_connection(monkeypatch, calls, response_payload: bytes) -> None:
+    _clear_proxy_env(monkeypatch)
+    monkeypatch.setattr(llama_server, "_POOLS", {})
+    monkeypatch.setattr(
+        llama_server, "HTTPConnection", _fake_connection_factory(calls, response_payload)
+    )
 
 
 def test_llama_backend_logging_skipped_when_unset(monkeypatch, caplog) -> None:
@@ -31,10 +63,7 @@ def test_llama_backend_logging_skipped_when_unset(monkeypatch, caplog) -> None:
     response_payload = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode(
         "utf-8"
     )
-    monkeypatch.setattr(
-        "spectator.backends.llama_server.urllib.request.urlopen",
-        _fake_urlopen_factory(calls, response_payload),
-    )
+    _patch_connection(monkeypatch, calls, response_payload)
 
     backend = LlamaServerBackend()
     with caplog.at_level(logging.INFO, logger="spectator.backends.llama_server"):
@@ -56,10 +85,7 @@ def test_llama_backend_logging_enabled(monkeypatch, caplog) -> None:
     response_payload = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode(
         "utf-8"
     )
-    monkeypatch.setattr(
-        "spectator.backends.llama_server.urllib.request.urlopen",
-        _fake_urlopen_factory(calls, response_payload),
-    )
+    _patch_connection(monkeypatch, calls, response_payload)
 
     backend = LlamaServerBackend()
     params = {"messages": [{"role": "user", "content": "hello"}], "temperature": 0.25}
@@ -72,9 +98,165 @@ def test_llama_backend_logging_enabled(monkeypatch, caplog) -> None:
     assert result == "ok"
     assert calls
     request = calls[0]
-    assert request.data == json.dumps(expected_payload).encode("utf-8")
+    assert request["url"] == "/v1/chat/completions"
+    assert request["body"] == json.dumps(expected_payload).encode("utf-8")
     assert any(
         pretty_payload in record.getMessage()
         for record in caplog.records
         if record.name == "spectator.backends.llama_server"
     )
+
+
+def test_llama_backend_reuses_pooled_connection(monkeypatch) -> None:
+    monkeypatch.delenv("SPECTATOR_LLAMA_LOG_PAYLOAD", raising=False)
+    calls: list[dict[str, object]] = []
+    connections: list[object] = []
+    response_payload = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode(
+        "utf-8"
+    )
+    connection_cls = _fake_connection_factory(calls, response_payload)
+
+    def make_connection(*args, **kwargs):
+        connection = connection_cls(*args, **kwargs)
+        connections.append(connection)
+        return connection
+
+    _clear_proxy_env(monkeypatch)
+    monkeypatch.setattr(llama_server, "_POOLS", {})
+    monkeypatch.setattr(llama_server, "HTTPConnection", make_connection)
+
+    backend = LlamaServerBackend(base_url="http://127.0.0.1:8080/")
+    assert backend.complete("one", {}) == "ok"
+    assert backend.complete("two", {}) == "ok"
+
+    assert len(calls) == 2
+    assert len(connections) == 1
+
+
+def test_llama_backend_http_error_reports_full_url(monkeypatch) -> None:
+    monkeypatch.delenv("SPECTATOR_LLAMA_LOG_PAYLOAD", raising=False)
+    calls: list[dict[str, object]] = []
+    connection_cls = _fake_connection_factory(calls, b"")
+
+    class ErrorConnection(connection_cls):
+        def getresponse(self):
+            response = super().getresponse()
+            response.status = 503
+            response.reason = "Service Unavailable"
+            return response
+
+    _clear_proxy_env(monkeypatch)
+    monkeypatch.setattr(llama_server, "_POOLS", {})
+    monkeypatch.setattr(llama_server, "HTTPConnection", ErrorConnection)
+
+    backend = LlamaServerBackend(base_url="http://llama.local:8080/api/")
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        backend.complete("hello", {})
+
+    assert excinfo.value.url == "http://llama.local:8080/api/v1/chat/completions"
+    assert calls[0]["url"] == "/api/v1/chat/completions"
+
+
+def test_llama_backend_uses_urlopen_behind_proxy(monkeypatch) -> None:
+    monkeypatch.delenv("SPECTATOR_LLAMA_LOG_PAYLOAD", raising=False)
+    _clear_proxy_env(monkeypatch)
+    monkeypatch.setenv("http_proxy", "http://proxy.local:3128")
+    monkeypatch.setattr(llama_server, "_POOLS", {})
+    requests: list[object] = []
+    response_payload = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode(
+        "utf-8"
+    )
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            return None
+
+        def read(self) -> bytes:
+            return response_payload
+
+    def fake_urlopen(request, timeout: float) -> FakeResponse:  # noqa: ARG001
+        requests.append(request)
+        return FakeResponse()
+
+    def fail_connection(*_args, **_kwargs):
+        raise AssertionError("pooled connection used behind a proxy")
+
+    monkeypatch.setattr(llama_server.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(llama_server, "HTTPConnection", fail_connection)
+
+    backend = LlamaServerBackend(base_url="http://llama.local:8080")
+    assert backend.complete("hello", {}) == "ok"
+    assert [request.full_url for request in requests] == [
+        "http://llama.local:8080/v1/chat/completions"
+    ]
+
+
+def test_llama_backend_acomplete_runs_concurrently(monkeypatch) -> None:
+    monkeypatch.delenv("SPECTATOR_LLAMA_LOG_PAYLOAD", raising=False)
+    calls: list[dict[str, object]] = []
+    response_payload = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode(
+        "utf-8"
+    )
+    _patch_connection(monkeypatch, calls, response_payload)
+    backend = LlamaServerBackend()
+
+    async def run_all() -> list[str]:
+        return await asyncio.gather(*(backend.acomplete(f"p{i}", {}) for i in range(4)))
+
+    assert asyncio.run(run_all()) == ["ok"] * 4
+    assert len(calls) == 4
+
+
+def test_llama_backend_sse_parser_handles_split_chunks() -> None:
+    stream = (
+        'data: {"a": "h\u00e9"}\r\n\r\n: keep-alive\n\ndata: [DONE]'.encode("utf-8")
+    )
+    chunks = [stream[i : i + 3] for i in range(0, len(stream), 3)]
+
+    assert list(LlamaServerBackend._iter_sse_data(chunks)) == ['{"a": "h\u00e9"}', "[DONE]"]
+
+
+def test_llama_backend_logging_writes_unique_files(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("SPECTATOR_LLAMA_LOG_PAYLOAD", "1")
+    monkeypatch.setenv("SPECTATOR_LLAMA_LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(llama_server.time, "time_ns", lambda: 123)
+    backend = LlamaServerBackend()
+    payload = backend._build_payload("hello", {})
+
+    backend._log_payload(payload)
+    backend._log_payload(payload)
+
+    files = sorted(tmp_path.glob("llama_payload_*.json"))
+    assert len(files) == 2
+    assert json.loads(files[0].read_text(encoding="utf-8")) == payload
+
+
+def test_llama_backend_extract_delta_tolerates_unexpected_chunks() -> None:
+    extract = LlamaServerBackend._extract_delta
+
+    assert extract({"choices": [{"delta": {"content": "hi"}}]}) == "hi"
+    assert extract({"choices": [{"text": "raw"}]}) == "raw"
+    assert extract({"choices": [{"delta": {}}]}) == ""
+    assert extract({"choices": []}) == ""
+    assert extract(["not", "a", "dict"]) == ""
+
+
+def test_llama_backend_sends_authorization_header(monkeypatch) -> None:
+    monkeypatch.delenv("SPECTATOR_LLAMA_LOG_PAYLOAD", raising=False)
+    calls: list[dict[str, object]] = []
+    response_payload = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode(
+        "utf-8"
+    )
+    _patch_connection(monkeypatch, calls, response_payload)
+
+    LlamaServerBackend(api_key="secret").complete("hello", {})
+    LlamaServerBackend(api_key=None).complete("hello", {})
+
+    assert calls[0]["headers"] == {
+        "Content-Type": "application/json",
+        "Authorization": "Bearer secret",
+    }
+    assert calls[1]["headers"] == {"Content-Type": "application/json"}
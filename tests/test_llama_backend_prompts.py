@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from spectator.backends.llama_server import LlamaServerBackend
+from spectator.backends.llama_server import LlamaServerBackend, build_system_rules
 from spectator.prompts import load_prompt
 
 
@@ -15,6 +15,7 @@ def test_llama_backend_build_payload_injects_system_rules() -> None:
     assert payload["top_p"] == 1
     assert payload["max_tokens"] == 512
     assert payload["seed"] == 7
+    assert payload["cache_prompt"] is True
 
 
 def test_llama_backend_build_payload_respects_messages_override() -> None:
@@ -35,3 +36,22 @@ def test_llama_backend_rules_env_override(monkeypatch) -> None:
 
     assert payload["messages"][0]["role"] == "system"
     assert load_prompt("system/test_llama_rules.txt") in payload["messages"][0]["content"]
+
+
+def test_llama_backend_build_payload_does_not_repeat_rules() -> None:
+    backend = LlamaServerBackend()
+    rules = build_system_rules(backend.model)
+    messages = [
+        {"role": "system", "content": f"{rules}\n\nrole prompt"},
+        {"role": "user", "content": "hello"},
+    ]
+    payload = backend._build_payload("hello", {"messages": messages})
+
+    assert payload["messages"][0]["content"] == f"{rules}\n\nrole prompt"
+
+
+def test_llama_backend_build_payload_allows_disabling_prompt_cache() -> None:
+    backend = LlamaServerBackend()
+    payload = backend._build_payload("hello", {"cache_prompt": False})
+
+    assert payload["cache_prompt"] is False
@@ -59,6 +59,10 @@ def test_analyze_soak_pass(tmp_path: Path) -> None:
     summary = analyze_soak(trace_path, checkpoint_path, turns=1)
 
     assert summary.failures == []
+    assert summary.trace_bytes == trace_path.stat().st_size
+    assert summary.checkpoint_bytes == checkpoint_path.stat().st_size
+    assert summary.event_counts["tool_done"] == 1
+    assert summary.tool_counts == {"fs.read_text": 1}
 
 
 def test_analyze_soak_checkpoint_fail(tmp_path: Path) -> None:
@@ -85,3 +89,31 @@ def test_analyze_soak_checkpoint_fail(tmp_path: Path) -> None:
     summary = analyze_soak(trace_path, checkpoint_path, turns=1)
 
     assert any("Capabilities pending intersect with granted" in item for item in summary.failures)
+
+
+def test_analyze_soak_reparses_rewritten_checkpoint(tmp_path: Path) -> None:
+    trace_path = tmp_path / "trace.jsonl"
+    checkpoint_path = tmp_path / "checkpoint.json"
+    _write_trace(trace_path, [{"ts": 0.0, "kind": "notes_patch", "data": {}}])
+    _write_checkpoint(checkpoint_path)
+
+    first = analyze_soak(trace_path, checkpoint_path, turns=1)
+    _write_checkpoint(checkpoint_path, state_overrides={"memory_refs": ["m1", "m1"]})
+    second = analyze_soak(trace_path, checkpoint_path, turns=1)
+
+    assert first.failures == []
+    assert "Duplicate IDs found in memory_refs." in second.failures
+
+
+def test_analyze_soak_baseline_without_keys_only_warns(tmp_path: Path) -> None:
+    trace_path = tmp_path / "trace.jsonl"
+    checkpoint_path = tmp_path / "checkpoint.json"
+    baseline_path = tmp_path / "baseline.json"
+    _write_trace(trace_path, [{"ts": 0.0, "kind": "notes_patch", "data": {}}])
+    _write_checkpoint(checkpoint_path)
+    baseline_path.write_text("{}", encoding="utf-8")
+
+    summary = analyze_soak(trace_path, checkpoint_path, turns=1, baseline_path=baseline_path)
+
+    assert summary.failures == []
+    assert sum("Baseline missing" in warning for warning in summary.warnings) == 3
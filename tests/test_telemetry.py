@@ -1,3 +1,4 @@
+import spectator.core.telemetry as telemetry
 from spectator.core.telemetry import TelemetrySnapshot, collect_basic_telemetry
 
 
@@ -16,3 +17,19 @@ def test_collect_basic_telemetry_ram_types() -> None:
 
     assert snapshot.ram_total_mb is None or isinstance(snapshot.ram_total_mb, int)
     assert snapshot.ram_avail_mb is None or isinstance(snapshot.ram_avail_mb, int)
+
+
+def test_read_meminfo_parses_bytes_and_caches_total(monkeypatch, tmp_path) -> None:
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_bytes(
+        b"MemTotal:       16384000 kB\n"
+        b"MemFree:         1024000 kB\n"
+        b"MemAvailable:    8192000 kB\n"
+    )
+    monkeypatch.setattr(telemetry, "_MEMINFO_PATH", str(meminfo))
+    monkeypatch.setattr(telemetry, "_TOTAL_MB", None)
+
+    assert telemetry._read_meminfo_mb() == (16000, 8000)
+
+    meminfo.write_bytes(b"MemTotal:       1 kB\nMemAvailable:    4096000 kB\n")
+    assert telemetry._read_meminfo_mb() == (16000, 4000)
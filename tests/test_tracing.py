@@ -23,3 +23,72 @@ def test_trace_writer_path_includes_run_id(tmp_path: Path) -> None:
     writer = TraceWriter("session-2", base_dir=tmp_path / "data" / "traces", run_id="rev-3")
 
     assert writer.path.name == "session-2__rev-3.jsonl"
+
+
+def test_trace_writer_write_many_appends_all_events(tmp_path: Path) -> None:
+    writer = TraceWriter("session-3", base_dir=tmp_path / "traces")
+    writer.write(TraceEvent(kind="first", ts=1.0))
+
+    path = writer.write_many(
+        TraceEvent(kind="chunk", ts=2.0, data={"index": index}) for index in range(3)
+    )
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["kind"] for line in lines] == ["first", "chunk", "chunk", "chunk"]
+    assert [json.loads(line)["data"].get("index") for line in lines[1:]] == [0, 1, 2]
+
+
+def test_trace_writer_serialises_nested_dataclasses(tmp_path: Path) -> None:
+    writer = TraceWriter("session-4", base_dir=tmp_path / "traces")
+    nested = TraceEvent(kind="inner", ts=1.0, data={"x": 1})
+
+    path = writer.write(TraceEvent(kind="outer", ts=2.0, data={"nested": nested}))
+
+    parsed = json.loads(path.read_text(encoding="utf-8"))
+    assert parsed["data"]["nested"] == {"ts": 1.0, "kind": "inner", "data": {"x": 1}}
+
+
+def test_trace_writer_keeps_file_open_until_closed(tmp_path: Path) -> None:
+    with TraceWriter("session-5", base_dir=tmp_path / "traces", keep_open=True) as writer:
+        writer.write(TraceEvent(kind="first", ts=1.0))
+        handle = writer._handle
+        writer.write(TraceEvent(kind="second", ts=2.0))
+
+        assert writer._handle is handle
+        lines = writer.path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["kind"] for line in lines] == ["first", "second"]
+
+    assert handle is not None and handle.closed
+
+
+def test_trace_writer_follows_run_id_changes(tmp_path: Path) -> None:
+    with TraceWriter("session-6", base_dir=tmp_path, run_id="rev-1", keep_open=True) as writer:
+        first = writer.write(TraceEvent(kind="a", ts=1.0))
+        writer.run_id = "rev-2"
+        second = writer.write(TraceEvent(kind="b", ts=2.0))
+
+    assert first.name == "session-6__rev-1.jsonl"
+    assert second.name == "session-6__rev-2.jsonl"
+    assert len(second.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_trace_writer_wrote_any_tracks_current_path(tmp_path: Path) -> None:
+    with TraceWriter("session-7", base_dir=tmp_path, run_id="rev-1") as writer:
+        assert not writer.wrote_any
+        writer.write(TraceEvent(kind="a", ts=1.0))
+        assert writer.wrote_any
+        writer.run_id = "rev-2"
+        assert not writer.wrote_any
+
+    writer.run_id = "rev-1"
+    assert writer.wrote_any
+
+
+def test_trace_writer_closes_file_per_write_by_default(tmp_path: Path) -> None:
+    writer = TraceWriter("session-8", base_dir=tmp_path)
+
+    path = writer.write(TraceEvent(kind="a", ts=1.0))
+
+    assert writer._handle is None
+    assert writer.wrote_any
+    assert json.loads(path.read_text(encoding="utf-8"))["kind"] == "a"
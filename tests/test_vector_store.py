@@ -1,3 +1,4 @@
+from array import array
 from pathlib import Path
 
 from spectator.memory.embeddings import HashEmbedder
@@ -20,3 +21,50 @@ def test_vector_store_add_and_query(tmp_path: Path) -> None:
 
     assert results
     assert results[0][0].id == "one"
+
+
+def test_vector_store_query_returns_ranked_records_with_metadata(tmp_path: Path) -> None:
+    store = SQLiteVectorStore(tmp_path / "memory.sqlite")
+    records = [
+        MemoryRecord(id="near", ts=1.0, text="a", tags=["x"], meta={"n": 1}),
+        MemoryRecord(id="far", ts=2.0, text="b", tags=["y"], meta={"n": 2}),
+        MemoryRecord(id="other-dim", ts=3.0, text="c"),
+    ]
+    store.add(records, [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0, 0.0]])
+
+    results = store.query([1.0, 0.1], top_k=10)
+
+    assert [record.id for record, _ in results] == ["near", "far"]
+    assert results[0][0] == records[0]
+    assert results[0][1] > results[1][1]
+
+
+def test_vector_store_migrates_stores_without_norm_column(tmp_path: Path) -> None:
+    import sqlite3
+    from contextlib import closing
+
+    path = tmp_path / "legacy.sqlite"
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute(
+            "CREATE TABLE memory_records "
+            "(id TEXT PRIMARY KEY, ts REAL NOT NULL, text TEXT NOT NULL, "
+            "tags TEXT NOT NULL, meta TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE memory_vectors "
+            "(record_id TEXT PRIMARY KEY, dim INTEGER NOT NULL, vector BLOB NOT NULL)"
+        )
+        conn.execute("INSERT INTO memory_records VALUES ('old', 1.0, 'legacy', '[]', '{}')")
+        conn.execute(
+            "INSERT INTO memory_vectors VALUES ('old', 2, ?)",
+            (array("f", [3.0, 4.0]).tobytes(),),
+        )
+
+    store = SQLiteVectorStore(path)
+    store.add([MemoryRecord(id="new", ts=2.0, text="fresh")], [[0.0, 1.0]])
+
+    results = store.query([3.0, 4.0], top_k=2)
+
+    assert [record.id for record, _ in results] == ["old", "new"]
+    assert abs(results[0][1] - 1.0) < 1e-6
+    assert abs(results[1][1] - 0.8) < 1e-6